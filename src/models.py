@@ -1,10 +1,18 @@
+import math
 import re
+from array import array
 from datetime import date
 from src.exceptions import ParticipanteInvalido, LanceInvalido, LeilaoInvalido
 
+# Padrões pré-compilados usados na validação de participantes
+_CPF_STRIP = re.compile(r'[^0-9]')
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\Z")
+
 class Participante:
     """Representa um participante do leilão."""
 
+    __slots__ = ('nome', 'cpf', 'email', 'data_nascimento', '_possui_lances')
+
     def __init__(self, nome: str, cpf: str, email: str, data_nascimento: date):
         """Inicializa um participante.
 
@@ -19,7 +27,8 @@ class Participante:
         """
         if not nome or not isinstance(nome, str):
             raise ValueError("Nome inválido.")
-        if not self._validar_cpf(cpf):
+        cpf_numerico = self._formatar_cpf(cpf) # Normaliza uma única vez
+        if len(cpf_numerico) != 11:
             raise ValueError("CPF inválido.")
         if not self._validar_email(email):
             raise ValueError("Email inválido.")
@@ -27,29 +36,26 @@ class Participante:
             raise ValueError("Data de nascimento inválida.")
 
         self.nome = nome
-        self.cpf = self._formatar_cpf(cpf)
+        self.cpf = cpf_numerico
         self.email = email
         self.data_nascimento = data_nascimento
         self._possui_lances = False # Controle interno para regra de exclusão
 
-    def _validar_cpf(self, cpf: str) -> bool:
-        """Valida o formato básico do CPF (11 dígitos)."""
-        if not cpf or not isinstance(cpf, str):
-            return False
-        cpf_numerico = re.sub(r'[^0-9]', '', cpf)
-        return len(cpf_numerico) == 11
-
     def _formatar_cpf(self, cpf: str) -> str:
-        """Retorna o CPF contendo apenas números."""
-        return re.sub(r'[^0-9]', '', cpf)
+        """Retorna o CPF contendo apenas números (vazio se não for uma string)."""
+        if not cpf or not isinstance(cpf, str):
+            return ""
+        return _CPF_STRIP.sub('', cpf)
 
     def _validar_email(self, email: str) -> bool:
         """Valida o formato básico do email."""
         if not email or not isinstance(email, str):
             return False
+        # Rejeições triviais antes de executar a regex
+        if '@' not in email or len(email) > 320:
+            return False
         # Regex simples para validação de formato
-        pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        return re.match(pattern, email) is not None
+        return _EMAIL_RE.match(email) is not None
 
     def marcar_como_ofertante(self):
         """Marca que este participante já fez pelo menos um lance."""
@@ -63,7 +69,9 @@ class Participante:
     def __eq__(self, other):
         if not isinstance(other, Participante):
             return NotImplemented
-        return self.cpf == other.cpf or self.email == other.email
+        # Igualdade pelo CPF, coerente com __hash__; a unicidade do email é
+        # garantida pelo SistemaLeiloes no cadastro
+        return self.cpf == other.cpf
 
     def __hash__(self):
         # Usar CPF como hash principal, pois é o identificador único primário
@@ -80,6 +88,8 @@ class Participante:
 class Lance:
     """Representa um lance em um leilão."""
 
+    __slots__ = ('participante', 'valor')
+
     def __init__(self, participante: Participante, valor: float):
         """Inicializa um lance.
 
@@ -94,36 +104,57 @@ class Lance:
             raise TypeError("Participante inválido para o lance.")
         if not isinstance(valor, (int, float)) or valor <= 0:
             raise ValueError("O valor do lance deve ser positivo.")
+        if not math.isfinite(valor):
+            raise ValueError("O valor do lance deve ser um número finito.")
 
         self.participante = participante
         self.valor = float(valor)
 
+    @classmethod
+    def _unchecked(cls, participante: Participante, valor: float) -> "Lance":
+        """Cria um lance sem validar os argumentos.
+
+        Uso interno, para dados que já foram validados (ex.: lances registrados em um leilão).
+        """
+        lance = cls.__new__(cls)
+        lance.participante = participante
+        lance.valor = valor
+        return lance
+
+    # As comparações acessam os atributos diretamente e só devolvem
+    # NotImplemented quando o outro operando não se parece com um lance.
+
     def __eq__(self, other):
-        if not isinstance(other, Lance):
-            return NotImplemented
         # Considera lances iguais se participante e valor forem os mesmos
         # Embora na prática isso não deva ocorrer em sequência no mesmo leilão
-        return self.participante == other.participante and self.valor == other.valor
+        try:
+            return self.participante == other.participante and self.valor == other.valor
+        except AttributeError:
+            return NotImplemented
 
     def __lt__(self, other):
-        if not isinstance(other, Lance):
+        try:
+            return self.valor < other.valor
+        except AttributeError:
             return NotImplemented
-        return self.valor < other.valor
 
     def __le__(self, other):
-        if not isinstance(other, Lance):
+        try:
+            return self.valor <= other.valor
+        except AttributeError:
             return NotImplemented
-        return self.valor <= other.valor
 
     def __gt__(self, other):
-        if not isinstance(other, Lance):
+        try:
+            return self.valor > other.valor
+        except AttributeError:
             return NotImplemented
-        return self.valor > other.valor
 
     def __ge__(self, other):
-        if not isinstance(other, Lance):
+        try:
+            return self.valor >= other.valor
+        except AttributeError:
             return NotImplemented
-        return self.valor >= other.valor
 
     def __str__(self):
         return f"Lance(Participante: {self.participante.nome}, Valor: R$ {self.valor:.2f})"
@@ -133,19 +164,29 @@ class Lance:
 
 # --- Classe Leilao --- (Conteúdo Omitido para Brevidade)
 from datetime import datetime, date, time
-from enum import Enum, auto
+from enum import IntEnum, auto
 
 from .exceptions import LanceInvalido, LeilaoInvalido
 
-class EstadoLeilao(Enum):
+class EstadoLeilao(IntEnum):
     INATIVO = auto()
     ABERTO = auto()
     FINALIZADO = auto()
     EXPIRADO = auto()
 
+# Os lances de um leilão ficam em dois vetores paralelos: `_valores` (array de
+# doubles) e `_ofertantes` (participante de cada lance). Objetos Lance só são
+# montados quando algum chamador os pede.
+#
+# Invariante: `_pode_receber_lance` só aceita lances estritamente maiores que o
+# último, portanto `Leilao._valores` está sempre em ordem crescente. O menor
+# lance está na posição 0 e o maior na posição -1.
+
 class Leilao:
     """Representa um leilão de um item."""
 
+    __slots__ = ('nome', 'lance_minimo', 'data_inicio', 'data_termino', '_valores', '_ofertantes', '_estado', '_ganhador')
+
     def __init__(self, nome: str, lance_minimo: float, data_inicio: datetime, data_termino: datetime):
         """Inicializa um leilão.
 
@@ -171,7 +212,8 @@ class Leilao:
         self.lance_minimo = float(lance_minimo)
         self.data_inicio = data_inicio
         self.data_termino = data_termino
-        self._lances: list[Lance] = []
+        self._valores = array('d')
+        self._ofertantes: list[Participante] = []
         self._estado = EstadoLeilao.INATIVO
         self._ganhador: Participante | None = None
 
@@ -183,29 +225,30 @@ class Leilao:
         self.atualizar_estado()
         return self._estado
 
+    def _lance_em(self, indice: int) -> Lance:
+        """Monta o objeto Lance armazenado na posição indicada."""
+        return Lance._unchecked(self._ofertantes[indice], self._valores[indice])
+
     @property
     def lances(self) -> list[Lance]:
-        """Retorna uma cópia da lista de lances ordenados por valor."""
-        return sorted(self._lances, key=lambda lance: lance.valor)
+        """Retorna uma lista com os lances ordenados por valor."""
+        # Já ordenados pela invariante de inserção
+        return [Lance._unchecked(participante, valor) for participante, valor in zip(self._ofertantes, self._valores)]
 
     @property
     def ultimo_lance(self) -> Lance | None:
         """Retorna o último lance válido recebido."""
-        return self._lances[-1] if self._lances else None
+        return self._lance_em(-1) if self._valores else None
 
     @property
     def maior_lance(self) -> Lance | None:
         """Retorna o maior lance do leilão."""
-        if not self._lances:
-            return None
-        return max(self._lances, key=lambda lance: lance.valor)
+        return self._lance_em(-1) if self._valores else None
 
     @property
     def menor_lance(self) -> Lance | None:
         """Retorna o menor lance do leilão."""
-        if not self._lances:
-            return None
-        return min(self._lances, key=lambda lance: lance.valor)
+        return self._lance_em(0) if self._valores else None
 
     @property
     def ganhador(self) -> Participante | None:
@@ -215,18 +258,22 @@ class Leilao:
         return None
 
     def _pode_receber_lance(self, participante: Participante, valor: float) -> bool:
-        """Verifica se um lance é válido para este leilão."""
-        if self.estado != EstadoLeilao.ABERTO:
+        """Verifica se um lance é válido para este leilão.
+
+        Usa o estado já calculado; quem chama deve ter executado `atualizar_estado`.
+        """
+        if self._estado != EstadoLeilao.ABERTO:
             return False # Só aceita lances se estiver ABERTO
         if valor < self.lance_minimo:
             return False # Lance abaixo do mínimo
-        if not self._lances:
+        if not self._valores:
             return True # Primeiro lance, sempre válido se > mínimo
 
-        ultimo = self.ultimo_lance
-        if valor <= ultimo.valor:
+        if valor <= self._valores[-1]:
             return False # Lance deve ser maior que o último
-        if participante == ultimo.participante:
+        ultimo_ofertante = self._ofertantes[-1]
+        # Identidade primeiro: no sistema, o ofertante é o mesmo objeto do cadastro
+        if participante is ultimo_ofertante or participante == ultimo_ofertante:
             return False # Mesmo participante não pode dar lances seguidos
 
         return True
@@ -238,39 +285,57 @@ class Leilao:
             lance: O objeto Lance a ser proposto.
 
         Raises:
+            TypeError: Se `lance` não for um objeto Lance.
             LanceInvalido: Se o lance não for válido pelas regras do leilão.
             LeilaoInvalido: Se o leilão não estiver no estado ABERTO.
         """
-        self.atualizar_estado() # Garante que o estado está atualizado
-        if self.estado != EstadoLeilao.ABERTO:
-            raise LeilaoInvalido(f"Leilão '{self.nome}' não está ABERTO para receber lances (Estado: {self.estado.name}).")
-
         if not isinstance(lance, Lance):
             raise TypeError("Objeto de lance inválido.")
+        self._propor_lance_unsafe(lance)
+
+    def _propor_lance_unsafe(self, lance: Lance, agora: datetime | None = None):
+        """Como `propor_lance`, mas sem verificar o tipo de `lance`.
+
+        Uso interno, quando o Lance acabou de ser construído (e validado) por quem chama.
+        `agora` é repassado a `atualizar_estado` (operações em lote leem o relógio uma vez).
+        """
+        self.atualizar_estado(agora) # Única atualização; daqui em diante lê-se `_estado`
+        if self._estado != EstadoLeilao.ABERTO:
+            raise LeilaoInvalido(f"Leilão '{self.nome}' não está ABERTO para receber lances (Estado: {self._estado.name}).")
+
         if not self._pode_receber_lance(lance.participante, lance.valor):
             # Determine the reason for invalidity
             motivo = "desconhecido" # Default reason (should ideally be covered by specific checks)
             if lance.valor < self.lance_minimo:
                 motivo = f"valor (R$ {lance.valor:.2f}) abaixo do mínimo (R$ {self.lance_minimo:.2f})"
-            elif self._lances:
-                ultimo = self.ultimo_lance
-                if lance.valor <= ultimo.valor:
-                    motivo = f"valor (R$ {lance.valor:.2f}) não é maior que o último lance (R$ {ultimo.valor:.2f})"
-                elif lance.participante == ultimo.participante:
+            elif self._valores:
+                ultimo_valor = self._valores[-1]
+                if lance.valor <= ultimo_valor:
+                    motivo = f"valor (R$ {lance.valor:.2f}) não é maior que o último lance (R$ {ultimo_valor:.2f})"
+                elif lance.participante == self._ofertantes[-1]:
                     motivo = "participante não pode dar dois lances seguidos"
             raise LanceInvalido(f"Lance inválido para o leilão \'{self.nome}\'. Motivo: {motivo}.")
-        self._lances.append(lance)
+        # `_valores` fica estritamente crescente (Lance rejeita NaN/inf), invariante da qual
+        # dependem `lances`, `maior_lance`, `menor_lance` e o ganhador
+        self._valores.append(lance.valor)
+        self._ofertantes.append(lance.participante)
         lance.participante.marcar_como_ofertante() # Marca que o participante fez um lance
 
-    def atualizar_estado(self):
-        """Atualiza o estado do leilão com base nas datas e lances."""
-        agora = datetime.now()
+    def atualizar_estado(self, agora: datetime | None = None):
+        """Atualiza o estado do leilão com base nas datas e lances.
 
+        Args:
+            agora: Instante de referência. Se omitido, usa `datetime.now()`.
+                Permite que operações em lote leiam o relógio uma única vez.
+        """
         # Apenas FINALIZADO é um estado que nunca deve mudar.
-        # EXPIRADO pode, teoricamente, ser recalculado (útil para testes).
-        if self._estado == EstadoLeilao.FINALIZADO:
+        # EXPIRADO não é terminal: alterar_leilao pode mudar as datas e reabrir o ciclo.
+        if self._estado is EstadoLeilao.FINALIZADO:
             return # Estados finais não mudam
 
+        if agora is None:
+            agora = datetime.now()
+
         if agora < self.data_inicio:
             self._estado = EstadoLeilao.INATIVO
         elif self.data_inicio <= agora < self.data_termino:
@@ -278,12 +343,10 @@ class Leilao:
             # Ou se estava EXPIRADO e o tempo "voltou" (teste), abre.
             self._estado = EstadoLeilao.ABERTO
         elif agora >= self.data_termino:
-            if self._lances:
+            if self._valores:
                 self._estado = EstadoLeilao.FINALIZADO
-                # Define o ganhador ao finalizar
-                maior = self.maior_lance
-                if maior:
-                    self._ganhador = maior.participante
+                # Define o ganhador ao finalizar: autor do maior (último) lance
+                self._ganhador = self._ofertantes[-1]
             else:
                 # Se não tem lances e terminou, vai para EXPIRADO.
                 self._estado = EstadoLeilao.EXPIRADO
@@ -307,11 +370,11 @@ class Leilao:
     @property
     def pode_ser_alterado_ou_excluido(self) -> bool:
         """Verifica se o leilão pode ser alterado ou excluído (apenas INATIVO ou EXPIRADO)."""
-        estado_atual = self.estado # Atualiza e obtém o estado
-        return estado_atual == EstadoLeilao.INATIVO or estado_atual == EstadoLeilao.EXPIRADO
+        self.atualizar_estado()
+        return self._estado == EstadoLeilao.INATIVO or self._estado == EstadoLeilao.EXPIRADO
 
     def __str__(self):
-        return f"Leilão(Nome: {self.nome}, Estado: {self.estado.name}, Lances: {len(self._lances)})"
+        return f"Leilão(Nome: {self.nome}, Estado: {self.estado.name}, Lances: {len(self._valores)})"
 
     def __repr__(self):
         return (f"Leilao(nome='{self.nome}', lance_minimo={self.lance_minimo}, "
@@ -1,16 +1,38 @@
 from datetime import datetime, date, time
-from typing import List, Optional
+import logging
+import sys
+from typing import Callable, Iterable, List, Optional, Tuple
 import re # Importar re para usar na formatação do CPF
 
 from src.models import Participante, Leilao, EstadoLeilao, Lance
 from src.exceptions import ParticipanteInvalido, LeilaoInvalido, LanceInvalido
 
+_CPF_STRIP = re.compile(r'[^0-9]')
+
+# Inconsistências internas são registradas em log; a aplicação decide se e onde exibi-las
+_LOG = logging.getLogger("leilao")
+_LOG.addHandler(logging.NullHandler())
+
+def _internar(nome: str) -> str:
+    """Interna o nome usado como chave, para que buscas com a mesma string resolvam por identidade.
+
+    Subclasses de `str` não podem ser internadas e são mantidas como recebidas.
+    """
+    return sys.intern(nome) if type(nome) is str else nome
+
 class SistemaLeiloes:
     """Gerencia o cadastro e operações de participantes e leilões."""
 
-    def __init__(self):
+    def __init__(self, verboso: bool = True):
+        """Inicializa o sistema.
+
+        Args:
+            verboso: Se False, as mensagens de notificação não são exibidas.
+        """
+        self.verboso = verboso
         self._participantes: dict[str, Participante] = {} # CPF -> Participante
-        self._leiloes: list[Leilao] = []
+        self._participantes_por_email: dict[str, Participante] = {} # Email -> Participante
+        self._leiloes: dict[str, Leilao] = {} # Nome -> Leilao (ordem de cadastro)
 
     # --- Gerenciamento de Participantes ---
 
@@ -20,17 +42,19 @@ class SistemaLeiloes:
         cpf_fmt = novo_participante.cpf # CPF já formatado pelo construtor de Participante
         if cpf_fmt in self._participantes:
             raise ParticipanteInvalido(f"CPF {cpf_fmt} já cadastrado.")
-        for p in self._participantes.values():
-            if p.email == novo_participante.email:
-                raise ParticipanteInvalido(f"Email {novo_participante.email} já cadastrado.")
+        if novo_participante.email in self._participantes_por_email:
+            raise ParticipanteInvalido(f"Email {novo_participante.email} já cadastrado.")
         self._participantes[cpf_fmt] = novo_participante
+        self._participantes_por_email[novo_participante.email] = novo_participante
         return novo_participante
 
     def _formatar_cpf_busca(self, cpf: str) -> str:
         """Helper para remover formatação do CPF para busca."""
         if not cpf or not isinstance(cpf, str):
             return ""
-        return re.sub(r'[^0-9]', '', cpf)
+        if len(cpf) == 11 and cpf.isascii() and cpf.isdigit():
+            return cpf # Já normalizado (caso comum: CPF obtido de `Participante.cpf`)
+        return _CPF_STRIP.sub('', cpf)
 
     def buscar_participante_por_cpf(self, cpf: str) -> Optional[Participante]:
         """Busca um participante pelo CPF."""
@@ -46,6 +70,7 @@ class SistemaLeiloes:
         if not participante.pode_ser_excluido:
             raise ParticipanteInvalido(f"Participante {participante.nome} (CPF: {cpf_fmt}) não pode ser excluído pois possui lances registrados.")
         del self._participantes[cpf_fmt]
+        del self._participantes_por_email[participante.email]
 
     @property
     def participantes(self) -> List[Participante]:
@@ -60,15 +85,15 @@ class SistemaLeiloes:
         if self.buscar_leilao_por_nome(nome):
              raise LeilaoInvalido(f"Já existe um leilão com o nome \'{nome}\'.")
         novo_leilao = Leilao(nome, lance_minimo, data_inicio, data_termino)
-        self._leiloes.append(novo_leilao)
+        novo_leilao.nome = _internar(novo_leilao.nome)
+        self._leiloes[novo_leilao.nome] = novo_leilao
         return novo_leilao
 
     def buscar_leilao_por_nome(self, nome: str) -> Optional[Leilao]:
         """Busca um leilão pelo nome."""
-        for leilao in self._leiloes:
-            if leilao.nome == nome:
-                return leilao
-        return None
+        if not self._leiloes or not isinstance(nome, str):
+            return None # Nomes não-string (possivelmente não hasheáveis) nunca estão cadastrados
+        return self._leiloes.get(nome)
 
     def alterar_leilao(self, nome_atual: str, novo_nome: Optional[str] = None, novo_lance_minimo: Optional[float] = None, nova_data_inicio: Optional[datetime] = None, nova_data_termino: Optional[datetime] = None):
         """Altera os dados de um leilão, se permitido."""
@@ -99,7 +124,12 @@ class SistemaLeiloes:
             raise ValueError("Novas datas de início e término devem ser objetos datetime.")
         if temp_data_inicio >= temp_data_termino:
             raise ValueError("Nova data de início deve ser anterior à nova data de término.")
+        temp_nome = _internar(temp_nome)
 
+        if temp_nome != leilao.nome:
+            # Reconstrói o índice para manter a ordem de cadastro na listagem
+            self._leiloes = {(temp_nome if item is leilao else nome): item
+                             for nome, item in self._leiloes.items()}
         leilao.nome = temp_nome
         leilao.lance_minimo = float(temp_lance_minimo)
         leilao.data_inicio = temp_data_inicio
@@ -108,41 +138,35 @@ class SistemaLeiloes:
 
     def excluir_leilao(self, nome: str):
         """Exclui um leilão do sistema, se permitido."""
-        leilao_para_excluir = None
-        indice_para_excluir = -1
-        for i, leilao in enumerate(self._leiloes):
-            if leilao.nome == nome:
-                leilao_para_excluir = leilao
-                indice_para_excluir = i
-                break
+        leilao_para_excluir = self.buscar_leilao_por_nome(nome)
         if not leilao_para_excluir:
             # Corrigido: String f fechada corretamente
             raise LeilaoInvalido(f"Leilão com nome \'{nome}\' não encontrado.")
         if not leilao_para_excluir.pode_ser_alterado_ou_excluido:
             # Corrigido: String f fechada corretamente
             raise LeilaoInvalido(f"Leilão \'{leilao_para_excluir.nome}\' não pode ser excluído (Estado: {leilao_para_excluir.estado.name}).")
-        del self._leiloes[indice_para_excluir]
+        del self._leiloes[nome]
+
+    def atualizar_todos_estados(self, agora: Optional[datetime] = None):
+        """Atualiza o estado de todos os leilões com uma única leitura do relógio."""
+        if agora is None:
+            agora = datetime.now()
+        for leilao in self._leiloes.values():
+            leilao.atualizar_estado(agora)
 
     def listar_leiloes(self, estado: Optional[EstadoLeilao] = None, data_inicio_intervalo: Optional[date] = None, data_fim_intervalo: Optional[date] = None) -> List[Leilao]:
         """Lista leilões, com filtros opcionais por estado e intervalo de datas."""
+        if not self._leiloes:
+            return [] # Nada a filtrar; evita montar os limites e ler o relógio
+        # Limites do intervalo calculados uma única vez; sem data, o intervalo fica aberto
+        filtro_inicio_dt = datetime.combine(data_inicio_intervalo, time.min) if data_inicio_intervalo is not None else datetime.min
+        filtro_fim_dt = datetime.combine(data_fim_intervalo, time.max) if data_fim_intervalo is not None else datetime.max
+        agora = datetime.now() # Uma única leitura do relógio para toda a listagem
         leiloes_filtrados = []
-        for leilao in self._leiloes:
-            leilao.atualizar_estado()
-            match = True
-            if estado is not None and leilao.estado != estado:
-                match = False
-            if match and (data_inicio_intervalo is not None or data_fim_intervalo is not None):
-                filtro_inicio_dt = datetime.combine(data_inicio_intervalo, time.min) if data_inicio_intervalo else datetime.min
-                filtro_fim_dt = datetime.combine(data_fim_intervalo, time.max) if data_fim_intervalo else datetime.max
-                # Ajuste para garantir que o filtro funcione corretamente se apenas uma data for fornecida
-                if data_inicio_intervalo is None:
-                    filtro_inicio_dt = datetime.min
-                if data_fim_intervalo is None:
-                    filtro_fim_dt = datetime.max
-
-                if not (leilao.data_inicio <= filtro_fim_dt and leilao.data_termino >= filtro_inicio_dt):
-                    match = False
-            if match:
+        for leilao in self._leiloes.values():
+            leilao.atualizar_estado(agora)
+            if ((estado is None or leilao._estado is estado)
+                    and leilao.data_inicio <= filtro_fim_dt and leilao.data_termino >= filtro_inicio_dt):
                 leiloes_filtrados.append(leilao)
         return leiloes_filtrados
 
@@ -158,7 +182,42 @@ class SistemaLeiloes:
             # Corrigido: String f fechada corretamente
             raise LeilaoInvalido(f"Leilão com nome \'{nome_leilao}\' não encontrado.")
         novo_lance = Lance(participante, valor_lance)
-        leilao.propor_lance(novo_lance) # Deixa a validação de regras para o Leilao
+        leilao._propor_lance_unsafe(novo_lance) # Deixa a validação de regras para o Leilao
+
+    def propor_lances_em_lote(self, lances: Iterable[Tuple[str, str, float]]) -> Tuple[List[Lance], List[Tuple[Tuple[str, str, float], Exception]]]:
+        """Propõe vários lances em sequência, com uma única leitura do relógio para todo o lote.
+
+        Um lance rejeitado não interrompe o lote.
+
+        Args:
+            lances: Tuplas (cpf_participante, nome_leilao, valor_lance), na ordem
+                em que devem ser aplicadas.
+
+        Returns:
+            Uma tupla (aceitos, rejeitados): os lances aceitos, na ordem em que foram
+            registrados, e pares (tupla do lance, exceção) com o motivo de cada rejeição.
+        """
+        agora = datetime.now() # Mesmo instante de referência para todos os lances do lote
+        aceitos = []
+        rejeitados = []
+        for item in lances:
+            cpf_participante, nome_leilao, valor_lance = item
+            participante = self.buscar_participante_por_cpf(cpf_participante)
+            if participante is None:
+                rejeitados.append((item, ParticipanteInvalido(f"Participante com CPF {cpf_participante} não encontrado.")))
+                continue
+            leilao = self.buscar_leilao_por_nome(nome_leilao)
+            if leilao is None:
+                rejeitados.append((item, LeilaoInvalido(f"Leilão com nome \'{nome_leilao}\' não encontrado.")))
+                continue
+            try:
+                novo_lance = Lance(participante, valor_lance)
+                leilao._propor_lance_unsafe(novo_lance, agora)
+            except (ValueError, LanceInvalido, LeilaoInvalido) as erro:
+                rejeitados.append((item, erro))
+                continue
+            aceitos.append(novo_lance)
+        return aceitos, rejeitados
 
     def listar_lances_leilao(self, nome_leilao: str) -> List[Lance]:
         """Retorna a lista de lances de um leilão específico, ordenada por valor."""
@@ -194,8 +253,22 @@ class SistemaLeiloes:
 
     # --- Notificação ---
 
-    def notificar_ganhador(self, nome_leilao: str) -> bool:
-        """Simula o envio de um email para o ganhador do leilão."""
+    def _exibir(self, texto: str):
+        """Escreve uma mensagem completa na saída padrão, se o modo verboso estiver ativo."""
+        if self.verboso:
+            sys.stdout.write(texto + "\n")
+
+    def notificar_ganhador(self, nome_leilao: str, escritor: Optional[Callable[[str], object]] = None) -> bool:
+        """Simula o envio de um email para o ganhador do leilão.
+
+        Args:
+            nome_leilao: Nome do leilão a notificar.
+            escritor: Função que recebe cada mensagem completa (sem quebra de linha final).
+                Se omitido, as mensagens vão para a saída padrão, respeitando `verboso`.
+
+        Estados inconsistentes do leilão são registrados como WARNING no logger "leilao".
+        """
+        exibir = self._exibir if escritor is None else escritor
         leilao = self.buscar_leilao_por_nome(nome_leilao)
         if not leilao:
              raise LeilaoInvalido(f"Leilão com nome \'{nome_leilao}\' não encontrado para notificação.")
@@ -205,33 +278,33 @@ class SistemaLeiloes:
         if ganhador:
             maior_lance = leilao.maior_lance
             if maior_lance: # Deve sempre existir se houver ganhador
-                print(f"--- SIMULAÇÃO DE EMAIL ---")
-                print(f"Para: {ganhador.email}")
-                # Corrigido: String f fechada corretamente
-                print(f"Assunto: Parabéns! Você venceu o leilão \'{leilao.nome}\'")
-                print(f"Prezado(a) {ganhador.nome},")
-                # Corrigido: String f fechada corretamente
-                print(f"Parabéns! Você arrematou o item \'{leilao.nome}\' com o lance de R$ {maior_lance.valor:.2f}.")
-                print(f"Detalhes do Leilão:")
-                print(f" - Nome: {leilao.nome}")
-                # Corrigido: String f fechada corretamente
-                print(f" - Data de Término: {leilao.data_termino.strftime('%d/%m/%Y %H:%M:%S')}")
-                print(f"Em breve entraremos em contato com mais informações.")
-                print(f"""Atenciosamente,
-Equipe Leilão System""")
-                print(f"--------------------------")
+                # Mensagem montada de uma vez e escrita numa única chamada
+                exibir(
+                    f"--- SIMULAÇÃO DE EMAIL ---\n"
+                    f"Para: {ganhador.email}\n"
+                    f"Assunto: Parabéns! Você venceu o leilão \'{leilao.nome}\'\n"
+                    f"Prezado(a) {ganhador.nome},\n"
+                    f"Parabéns! Você arrematou o item \'{leilao.nome}\' com o lance de R$ {maior_lance.valor:.2f}.\n"
+                    f"Detalhes do Leilão:\n"
+                    f" - Nome: {leilao.nome}\n"
+                    f" - Data de Término: {leilao.data_termino.strftime('%d/%m/%Y %H:%M:%S')}\n"
+                    f"Em breve entraremos em contato com mais informações.\n"
+                    f"Atenciosamente,\n"
+                    f"Equipe Leilão System\n"
+                    f"--------------------------"
+                )
                 return True
             else:
                  # Situação inesperada: ganhador sem maior lance?
-                 print(f"AVISO: Leilão \'{nome_leilao}\' tem ganhador mas não foi possível obter o maior lance.")
+                 _LOG.warning("Leilão %r tem ganhador mas não foi possível obter o maior lance.", nome_leilao)
                  return False
         elif leilao.estado == EstadoLeilao.FINALIZADO and not ganhador:
-             # Corrigido: String f fechada corretamente
-             print(f"AVISO: Leilão \'{nome_leilao}\' está FINALIZADO mas não possui ganhador definido.")
+             # Situação inesperada: FINALIZADO sem ganhador
+             _LOG.warning("Leilão %r está FINALIZADO mas não possui ganhador definido.", nome_leilao)
              return False
         elif leilao.estado != EstadoLeilao.FINALIZADO:
              # Corrigido: String f fechada corretamente
-             print(f"INFO: Leilão \'{nome_leilao}\' ainda não foi finalizado (Estado: {leilao.estado.name}). Nenhuma notificação enviada.")
+             exibir(f"INFO: Leilão \'{nome_leilao}\' ainda não foi finalizado (Estado: {leilao.estado.name}). Nenhuma notificação enviada.")
              return False
         else: # Caso leilão não encontrado (já tratado no início)
              return False
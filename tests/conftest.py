@@ -0,0 +1,12 @@
+"""Configuração do pytest para os testes.
+
+Carregado automaticamente pelo pytest antes da coleta (não deve ser importado
+pelos módulos de teste): coloca a raiz do projeto no sys.path para que `src`
+seja importável em qualquer modo de importação.
+"""
+import os
+import sys
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
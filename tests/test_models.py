@@ -1,12 +1,33 @@
+import re
 import unittest
 from datetime import date, datetime, timedelta
-import sys
-import os
 
 from src.models import Participante, Lance, Leilao, EstadoLeilao
 from src.exceptions import LanceInvalido, LeilaoInvalido, ParticipanteInvalido
 from freezegun import freeze_time # type: ignore
 
+# Padrões de mensagens de erro compilados uma única vez para todo o módulo
+_RE_NOME_INVALIDO = re.compile(r"Nome inválido")
+_RE_CPF_INVALIDO = re.compile(r"CPF inválido")
+_RE_EMAIL_INVALIDO = re.compile(r"Email inválido")
+_RE_DATA_NASCIMENTO_INVALIDA = re.compile(r"Data de nascimento inválida")
+_RE_PARTICIPANTE_LANCE_INVALIDO = re.compile(r"Participante inválido para o lance")
+_RE_VALOR_LANCE_INVALIDO = re.compile(r"O valor do lance deve ser positivo")
+_RE_VALOR_LANCE_NAO_FINITO = re.compile(r"O valor do lance deve ser um número finito")
+_RE_NOME_LEILAO_INVALIDO = re.compile(r"Nome do leilão inválido")
+_RE_LANCE_MINIMO_INVALIDO = re.compile(r"Lance mínimo deve ser positivo")
+_RE_DATAS_NAO_DATETIME = re.compile(r"Datas de início e término devem ser objetos datetime")
+_RE_DATAS_FORA_DE_ORDEM = re.compile(r"Data de início deve ser anterior à data de término")
+_RE_LANCES_SEGUIDOS = re.compile(r"participante não pode dar dois lances seguidos")
+_RE_OBJETO_LANCE_INVALIDO = re.compile(r"Objeto de lance inválido")
+_RE_VALOR_90_ABAIXO_DO_MINIMO = re.compile(r"valor \(R\$ 90\.00\) abaixo do mínimo \(R\$ 100\.00\)")
+_RE_VALOR_95_ABAIXO_DO_MINIMO = re.compile(r"valor \(R\$ 95\.00\) abaixo do mínimo \(R\$ 100\.00\)")
+_RE_VALOR_NAO_MAIOR_QUE_ULTIMO = re.compile(r"valor \(R\$ 100\.00\) não é maior que o último lance \(R\$ 100\.00\)")
+_RE_LEILAO_NAO_ABERTO = {
+    estado: re.compile(rf"não está ABERTO para receber lances \(Estado: {estado.name}\)")
+    for estado in (EstadoLeilao.INATIVO, EstadoLeilao.EXPIRADO, EstadoLeilao.FINALIZADO)
+}
+
 class TestParticipante(unittest.TestCase):
 
     def test_criar_participante_valido(self):
@@ -21,36 +42,34 @@ class TestParticipante(unittest.TestCase):
         p = Participante("Maria Oliveira", "123.456.789-00", "maria@test.net", date(1985, 1, 10))
         self.assertEqual(p.cpf, "12345678900") # Deve armazenar apenas números
 
+    # (argumentos do construtor, padrão esperado na mensagem de erro)
+    CASOS_PARTICIPANTE_INVALIDO = (
+        (("", "12345678900", "teste@email.com", date(2000, 1, 1)), _RE_NOME_INVALIDO),
+        ((None, "12345678900", "teste@email.com", date(2000, 1, 1)), _RE_NOME_INVALIDO),
+
+        (("Nome Valido", "123", "teste@email.com", date(2000, 1, 1)), _RE_CPF_INVALIDO),
+        (("Nome Valido", "1234567890", "teste@email.com", date(2000, 1, 1)), _RE_CPF_INVALIDO),
+        (("Nome Valido", "123456789000", "teste@email.com", date(2000, 1, 1)), _RE_CPF_INVALIDO),
+        (("Nome Valido", "1234567890²", "teste@email.com", date(2000, 1, 1)), _RE_CPF_INVALIDO), # Dígito não ASCII
+        (("Nome Valido", None, "teste@email.com", date(2000, 1, 1)), _RE_CPF_INVALIDO),
+
+        (("Nome Valido", "12345678900", "teste", date(2000, 1, 1)), _RE_EMAIL_INVALIDO),
+        (("Nome Valido", "12345678900", "teste@", date(2000, 1, 1)), _RE_EMAIL_INVALIDO),
+        (("Nome Valido", "12345678900", "teste@domain", date(2000, 1, 1)), _RE_EMAIL_INVALIDO),
+        (("Nome Valido", "12345678900", "teste@domain.", date(2000, 1, 1)), _RE_EMAIL_INVALIDO),
+        (("Nome Valido", "12345678900", "teste@domain.com\n", date(2000, 1, 1)), _RE_EMAIL_INVALIDO), # Quebra de linha final
+        (("Nome Valido", "12345678900", None, date(2000, 1, 1)), _RE_EMAIL_INVALIDO),
+        (("Nome Valido", "12345678900", "a" * 310 + "@domain.com", date(2000, 1, 1)), _RE_EMAIL_INVALIDO), # Acima de 320 caracteres
+
+        (("Nome Valido", "12345678900", "teste@email.com", "2000-01-01"), _RE_DATA_NASCIMENTO_INVALIDA), # String não é date
+        (("Nome Valido", "12345678900", "teste@email.com", None), _RE_DATA_NASCIMENTO_INVALIDA),
+    )
+
     def test_criar_participante_dados_invalidos(self):
-        with self.assertRaisesRegex(ValueError, "Nome inválido"):
-            Participante("", "12345678900", "teste@email.com", date(2000, 1, 1))
-        with self.assertRaisesRegex(ValueError, "Nome inválido"):
-            Participante(None, "12345678900", "teste@email.com", date(2000, 1, 1))
-
-        with self.assertRaisesRegex(ValueError, "CPF inválido"):
-            Participante("Nome Valido", "123", "teste@email.com", date(2000, 1, 1))
-        with self.assertRaisesRegex(ValueError, "CPF inválido"):
-            Participante("Nome Valido", "1234567890", "teste@email.com", date(2000, 1, 1))
-        with self.assertRaisesRegex(ValueError, "CPF inválido"):
-            Participante("Nome Valido", "123456789000", "teste@email.com", date(2000, 1, 1))
-        with self.assertRaisesRegex(ValueError, "CPF inválido"):
-            Participante("Nome Valido", None, "teste@email.com", date(2000, 1, 1))
-
-        with self.assertRaisesRegex(ValueError, "Email inválido"):
-            Participante("Nome Valido", "12345678900", "teste", date(2000, 1, 1))
-        with self.assertRaisesRegex(ValueError, "Email inválido"):
-            Participante("Nome Valido", "12345678900", "teste@", date(2000, 1, 1))
-        with self.assertRaisesRegex(ValueError, "Email inválido"):
-            Participante("Nome Valido", "12345678900", "teste@domain", date(2000, 1, 1))
-        with self.assertRaisesRegex(ValueError, "Email inválido"):
-            Participante("Nome Valido", "12345678900", "teste@domain.", date(2000, 1, 1))
-        with self.assertRaisesRegex(ValueError, "Email inválido"):
-            Participante("Nome Valido", "12345678900", None, date(2000, 1, 1))
-
-        with self.assertRaisesRegex(ValueError, "Data de nascimento inválida"):
-            Participante("Nome Valido", "12345678900", "teste@email.com", "2000-01-01") # String não é date
-        with self.assertRaisesRegex(ValueError, "Data de nascimento inválida"):
-            Participante("Nome Valido", "12345678900", "teste@email.com", None)
+        for args, padrao in self.CASOS_PARTICIPANTE_INVALIDO:
+            with self.subTest(args=args):
+                with self.assertRaisesRegex(ValueError, padrao):
+                    Participante(*args)
 
     def test_participante_marcar_como_ofertante(self):
         p = Participante("Carlos Souza", "98765432100", "carlos@domain.org", date(1978, 11, 22))
@@ -65,7 +84,7 @@ class TestParticipante(unittest.TestCase):
         p4 = Participante("Carlos Dias", "77788899900", "carlos@mail.com", date(1988, 9, 12))
 
         self.assertEqual(p1, p2) # Mesmo CPF
-        self.assertEqual(p1, p3) # Mesmo Email
+        self.assertNotEqual(p1, p3) # Mesmo Email, CPF diferente
         self.assertNotEqual(p1, p4)
         self.assertNotEqual(p2, p3) # CPF e Email diferentes
         self.assertNotEqual(p1, "Não é participante") # Comparação com tipo diferente
@@ -102,20 +121,28 @@ class TestLance(unittest.TestCase):
 
     def test_criar_lance_invalido(self):
         # Participante inválido
-        with self.assertRaisesRegex(TypeError, "Participante inválido para o lance"):
+        with self.assertRaisesRegex(TypeError, _RE_PARTICIPANTE_LANCE_INVALIDO):
             Lance("Não é participante", 100.0)
-        with self.assertRaisesRegex(TypeError, "Participante inválido para o lance"):
+        with self.assertRaisesRegex(TypeError, _RE_PARTICIPANTE_LANCE_INVALIDO):
             Lance(None, 100.0)
 
         # Valor inválido
-        with self.assertRaisesRegex(ValueError, "O valor do lance deve ser positivo"):
+        with self.assertRaisesRegex(ValueError, _RE_VALOR_LANCE_INVALIDO):
             Lance(self.participante_teste, 0)
-        with self.assertRaisesRegex(ValueError, "O valor do lance deve ser positivo"):
+        with self.assertRaisesRegex(ValueError, _RE_VALOR_LANCE_INVALIDO):
             Lance(self.participante_teste, -50.0)
-        with self.assertRaisesRegex(ValueError, "O valor do lance deve ser positivo"):
+        with self.assertRaisesRegex(ValueError, _RE_VALOR_LANCE_INVALIDO):
             Lance(self.participante_teste, "abc") # Tipo inválido
-        with self.assertRaisesRegex(ValueError, "O valor do lance deve ser positivo"):
+        with self.assertRaisesRegex(ValueError, _RE_VALOR_LANCE_INVALIDO):
             Lance(self.participante_teste, None)
+        with self.assertRaisesRegex(ValueError, _RE_VALOR_LANCE_INVALIDO):
+            Lance(self.participante_teste, float("-inf"))
+
+        # Valores não finitos quebrariam a ordenação dos lances registrados
+        with self.assertRaisesRegex(ValueError, _RE_VALOR_LANCE_NAO_FINITO):
+            Lance(self.participante_teste, float("nan"))
+        with self.assertRaisesRegex(ValueError, _RE_VALOR_LANCE_NAO_FINITO):
+            Lance(self.participante_teste, float("inf"))
 
     def test_lance_comparacao(self):
         p1 = Participante("P1", "11111111111", "p1@mail.com", date(2001,1,1))
@@ -179,15 +206,24 @@ class TestLance(unittest.TestCase):
 
 class TestLeilao(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # Participantes e datas de referência criados uma única vez para a classe
+        cls.participante1 = Participante("Alice", "11111111111", "alice@test.com", date(1991, 1, 1))
+        cls.participante2 = Participante("Bob", "22222222222", "bob@test.com", date(1992, 2, 2))
+        # Instante fixo; os testes que dependem do relógio congelam o tempo nele
+        cls.agora = datetime(2025, 5, 23, 12, 0, 0)
+        cls.amanha = cls.agora + timedelta(days=1)
+        cls.depois_amanha = cls.agora + timedelta(days=2)
+        cls.ontem = cls.agora - timedelta(days=1)
+        cls.anteontem = cls.agora - timedelta(days=2)
+
     def setUp(self):
-        self.participante1 = Participante("Alice", "11111111111", "alice@test.com", date(1991, 1, 1))
-        self.participante2 = Participante("Bob", "22222222222", "bob@test.com", date(1992, 2, 2))
-        self.agora = datetime.now()
-        self.amanha = self.agora + timedelta(days=1)
-        self.depois_amanha = self.agora + timedelta(days=2)
-        self.ontem = self.agora - timedelta(days=1)
-        self.anteontem = self.agora - timedelta(days=2)
+        # Os participantes são compartilhados; só o estado mutável é reiniciado
+        self.participante1._possui_lances = False
+        self.participante2._possui_lances = False
 
+    @freeze_time("2025-05-23 12:00:00")
     def test_criar_leilao_valido(self):
         leilao = Leilao("Console", 100.0, self.amanha, self.depois_amanha)
         self.assertEqual(leilao.nome, "Console")
@@ -202,27 +238,25 @@ class TestLeilao(unittest.TestCase):
         self.assertTrue(leilao.pode_ser_alterado_ou_excluido)
 
     def test_criar_leilao_dados_invalidos(self):
-        with self.assertRaisesRegex(ValueError, "Nome do leilão inválido"):
-            Leilao("", 100, self.amanha, self.depois_amanha)
-        with self.assertRaisesRegex(ValueError, "Nome do leilão inválido"):
-            Leilao(None, 100, self.amanha, self.depois_amanha)
-
-        with self.assertRaisesRegex(ValueError, "Lance mínimo deve ser positivo"):
-            Leilao("Item", 0, self.amanha, self.depois_amanha)
-        with self.assertRaisesRegex(ValueError, "Lance mínimo deve ser positivo"):
-            Leilao("Item", -50, self.amanha, self.depois_amanha)
-        with self.assertRaisesRegex(ValueError, "Lance mínimo deve ser positivo"):
-            Leilao("Item", "abc", self.amanha, self.depois_amanha)
-
-        with self.assertRaisesRegex(ValueError, "Datas de início e término devem ser objetos datetime"):
-            Leilao("Item", 100, "2025-06-01 10:00:00", self.depois_amanha)
-        with self.assertRaisesRegex(ValueError, "Datas de início e término devem ser objetos datetime"):
-            Leilao("Item", 100, self.amanha, None)
-
-        with self.assertRaisesRegex(ValueError, "Data de início deve ser anterior à data de término"):
-            Leilao("Item", 100, self.depois_amanha, self.amanha)
-        with self.assertRaisesRegex(ValueError, "Data de início deve ser anterior à data de término"):
-            Leilao("Item", 100, self.amanha, self.amanha)
+        # As datas dependem de setUpClass, por isso a tabela é montada aqui
+        casos = (
+            (("", 100, self.amanha, self.depois_amanha), _RE_NOME_LEILAO_INVALIDO),
+            ((None, 100, self.amanha, self.depois_amanha), _RE_NOME_LEILAO_INVALIDO),
+
+            (("Item", 0, self.amanha, self.depois_amanha), _RE_LANCE_MINIMO_INVALIDO),
+            (("Item", -50, self.amanha, self.depois_amanha), _RE_LANCE_MINIMO_INVALIDO),
+            (("Item", "abc", self.amanha, self.depois_amanha), _RE_LANCE_MINIMO_INVALIDO),
+
+            (("Item", 100, "2025-06-01 10:00:00", self.depois_amanha), _RE_DATAS_NAO_DATETIME),
+            (("Item", 100, self.amanha, None), _RE_DATAS_NAO_DATETIME),
+
+            (("Item", 100, self.depois_amanha, self.amanha), _RE_DATAS_FORA_DE_ORDEM),
+            (("Item", 100, self.amanha, self.amanha), _RE_DATAS_FORA_DE_ORDEM),
+        )
+        for args, padrao in casos:
+            with self.subTest(args=args):
+                with self.assertRaisesRegex(ValueError, padrao):
+                    Leilao(*args)
 
     @freeze_time("2025-05-23 12:00:00")
     def test_estado_inicial_inativo(self):
@@ -246,6 +280,7 @@ class TestLeilao(unittest.TestCase):
         self.assertTrue(leilao.pode_ser_alterado_ou_excluido)
         self.assertIsNone(leilao.ganhador)
 
+    @freeze_time("2025-05-23 12:00:00")
     def test_propor_lance_valido_primeiro(self):
         leilao = Leilao("Item Aberto", 100, self.ontem, self.amanha)
         lance = Lance(self.participante1, 110.0)
@@ -256,6 +291,7 @@ class TestLeilao(unittest.TestCase):
         self.assertEqual(leilao.menor_lance, lance)
         self.assertFalse(self.participante1.pode_ser_excluido) # Participante agora tem lance
 
+    @freeze_time("2025-05-23 12:00:00")
     def test_propor_lance_valido_segundo_maior(self):
         leilao = Leilao("Item Aberto", 100, self.ontem, self.amanha)
         lance1 = Lance(self.participante1, 110.0)
@@ -268,33 +304,33 @@ class TestLeilao(unittest.TestCase):
         self.assertEqual(leilao.menor_lance, lance1)
         self.assertEqual(leilao.lances, [lance1, lance2]) # Ordenado por valor
 
+    @freeze_time("2025-05-23 12:00:00")
     def test_propor_lance_invalido_leilao_nao_aberto(self):
         leilao_inativo = Leilao("Inativo", 100, self.amanha, self.depois_amanha)
         leilao_expirado = Leilao("Expirado", 100, self.anteontem, self.ontem)
         leilao_finalizado = Leilao("Finalizado", 100, self.anteontem, self.ontem)
-        # Forçar finalização com um lance
-        lance_finalizador = Lance(self.participante1, 110)
-        with freeze_time(self.anteontem + timedelta(hours=1)):
-             leilao_finalizado._estado = EstadoLeilao.ABERTO # Força abertura para aceitar lance
-             leilao_finalizado.propor_lance(lance_finalizador)
-        with freeze_time(self.agora):
-             leilao_finalizado.atualizar_estado() # Deve ir para FINALIZADO
-             self.assertEqual(leilao_finalizado.estado, EstadoLeilao.FINALIZADO)
+        # Forçar finalização injetando diretamente um lance e o estado terminal
+        leilao_finalizado._valores.append(110)
+        leilao_finalizado._ofertantes.append(self.participante1)
+        leilao_finalizado._ganhador = self.participante1
+        leilao_finalizado._estado = EstadoLeilao.FINALIZADO
+        self.assertEqual(leilao_finalizado.estado, EstadoLeilao.FINALIZADO)
 
         lance = Lance(self.participante2, 150)
 
-        with self.assertRaisesRegex(LeilaoInvalido, "não está ABERTO para receber lances \\(Estado: INATIVO\\)"):
+        with self.assertRaisesRegex(LeilaoInvalido, _RE_LEILAO_NAO_ABERTO[EstadoLeilao.INATIVO]):
             leilao_inativo.propor_lance(lance)
-        with self.assertRaisesRegex(LeilaoInvalido, "não está ABERTO para receber lances \\(Estado: EXPIRADO\\)"):
+        with self.assertRaisesRegex(LeilaoInvalido, _RE_LEILAO_NAO_ABERTO[EstadoLeilao.EXPIRADO]):
             leilao_expirado.propor_lance(lance)
-        with self.assertRaisesRegex(LeilaoInvalido, "não está ABERTO para receber lances \\(Estado: FINALIZADO\\)"):
+        with self.assertRaisesRegex(LeilaoInvalido, _RE_LEILAO_NAO_ABERTO[EstadoLeilao.FINALIZADO]):
             leilao_finalizado.propor_lance(lance)
 
+    @freeze_time("2025-05-23 12:00:00")
     def test_propor_lance_invalido_valor_baixo(self):
         leilao = Leilao("Item Aberto", 100, self.ontem, self.amanha)
         # Abaixo do mínimo
         lance_baixo = Lance(self.participante1, 90)
-        with self.assertRaisesRegex(LanceInvalido, "valor \\(R\\$ 90.00\\) abaixo do mínimo \\(R\\$ 100.00\\)"):
+        with self.assertRaisesRegex(LanceInvalido, _RE_VALOR_90_ABAIXO_DO_MINIMO):
             leilao.propor_lance(lance_baixo)
 
         # Igual ao mínimo (ok para primeiro lance)
@@ -305,20 +341,21 @@ class TestLeilao(unittest.TestCase):
         # Menor que o último lance (e também abaixo do mínimo neste caso)
         lance_menor_ultimo = Lance(self.participante2, 95)
         # O código verifica primeiro se está abaixo do mínimo.
-        with self.assertRaisesRegex(LanceInvalido, "valor \\(R\\$ 95.00\\) abaixo do mínimo \\(R\\$ 100.00\\)"):
+        with self.assertRaisesRegex(LanceInvalido, _RE_VALOR_95_ABAIXO_DO_MINIMO):
             leilao.propor_lance(lance_menor_ultimo)
 
         # Igual ao último lance
         lance_igual_ultimo = Lance(self.participante2, 100)
-        with self.assertRaisesRegex(LanceInvalido, "valor \\(R\\$ 100.00\\) não é maior que o último lance \\(R\\$ 100.00\\)"):
+        with self.assertRaisesRegex(LanceInvalido, _RE_VALOR_NAO_MAIOR_QUE_ULTIMO):
             leilao.propor_lance(lance_igual_ultimo)
 
+    @freeze_time("2025-05-23 12:00:00")
     def test_propor_lance_invalido_mesmo_participante_seguido(self):
         leilao = Leilao("Item Aberto", 100, self.ontem, self.amanha)
         lance1 = Lance(self.participante1, 110)
         leilao.propor_lance(lance1)
         lance2 = Lance(self.participante1, 120)
-        with self.assertRaisesRegex(LanceInvalido, "participante não pode dar dois lances seguidos"):
+        with self.assertRaisesRegex(LanceInvalido, _RE_LANCES_SEGUIDOS):
             leilao.propor_lance(lance2)
 
         # Deve ser possível se outro participante der lance no meio
@@ -328,9 +365,10 @@ class TestLeilao(unittest.TestCase):
         leilao.propor_lance(lance3)
         self.assertEqual(leilao.ultimo_lance, lance3)
 
+    @freeze_time("2025-05-23 12:00:00")
     def test_propor_lance_invalido_objeto_lance_errado(self):
         leilao = Leilao("Item Aberto", 100, self.ontem, self.amanha)
-        with self.assertRaisesRegex(TypeError, "Objeto de lance inválido"):
+        with self.assertRaisesRegex(TypeError, _RE_OBJETO_LANCE_INVALIDO):
             leilao.propor_lance("Não é um lance")
 
     @freeze_time("2025-05-20 12:00:00") # Antes do início
@@ -365,6 +403,22 @@ class TestLeilao(unittest.TestCase):
             self.assertEqual(leilao.estado, EstadoLeilao.FINALIZADO)
             self.assertEqual(leilao.ganhador, self.participante2)
 
+    def test_ganhador_apos_tentativas_de_lance_nao_finito(self):
+        leilao = Leilao("Ganhador Finito", 100, datetime(2025, 5, 21, 10, 0, 0), datetime(2025, 5, 22, 10, 0, 0))
+        with freeze_time("2025-05-21 15:00:00"): # Durante o leilão
+            leilao.propor_lance(Lance(self.participante1, 110))
+            for valor in (float("nan"), float("inf")):
+                with self.subTest(valor=valor):
+                    with self.assertRaisesRegex(ValueError, _RE_VALOR_LANCE_NAO_FINITO):
+                        leilao.propor_lance(Lance(self.participante2, valor))
+            leilao.propor_lance(Lance(self.participante2, 200))
+
+        with freeze_time("2025-05-22 10:00:00"): # Exatamente no fim
+            self.assertEqual(leilao.estado, EstadoLeilao.FINALIZADO)
+            # O ganhador é o ofertante do último lance, que é também o maior
+            self.assertEqual(leilao.ganhador, self.participante2)
+            self.assertEqual(leilao.maior_lance.valor, 200.0)
+
     @freeze_time("2025-05-21 15:00:00") # Durante o leilão
     def test_transicao_aberto_para_expirado(self):
         leilao = Leilao("Transição Expira", 100, datetime(2025, 5, 21, 10, 0, 0), datetime(2025, 5, 22, 10, 0, 0))
@@ -382,6 +436,15 @@ class TestLeilao(unittest.TestCase):
         with freeze_time("2025-05-22 11:00:00"): # Depois do fim
             self.assertEqual(leilao.estado, EstadoLeilao.EXPIRADO)
 
+    @freeze_time("2025-05-20 12:00:00")
+    def test_atualizar_estado_com_instante_informado(self):
+        leilao = Leilao("Instante", 100, datetime(2025, 5, 21, 10, 0, 0), datetime(2025, 5, 22, 10, 0, 0))
+        leilao.atualizar_estado(datetime(2025, 5, 21, 15, 0, 0))
+        self.assertEqual(leilao._estado, EstadoLeilao.ABERTO)
+        leilao.atualizar_estado(datetime(2025, 5, 22, 10, 0, 0))
+        self.assertEqual(leilao._estado, EstadoLeilao.EXPIRADO)
+
+    @freeze_time("2025-05-23 12:00:00")
     def test_lances_propriedade_ordenada(self):
         leilao = Leilao("Ordenado", 50, self.ontem, self.amanha)
         lance1 = Lance(self.participante1, 100)
@@ -403,6 +466,21 @@ class TestLeilao(unittest.TestCase):
         self.assertEqual(leilao.maior_lance, lance3)
         self.assertEqual(leilao.menor_lance, lance1)
 
+    @freeze_time("2025-05-23 12:00:00")
+    def test_maior_lance_apos_tentativa_de_lance_nao_finito(self):
+        leilao = Leilao("Não Finito", 100, self.ontem, self.amanha)
+        lance1 = Lance(self.participante1, 110)
+        leilao.propor_lance(lance1)
+        with self.assertRaisesRegex(ValueError, _RE_VALOR_LANCE_NAO_FINITO):
+            leilao.propor_lance(Lance(self.participante2, float("nan")))
+        lance2 = Lance(self.participante2, 200)
+        leilao.propor_lance(lance2)
+        # O maior lance é lido do fim de `_valores`, que segue ordenado
+        self.assertEqual(leilao.maior_lance, lance2)
+        self.assertEqual(leilao.menor_lance, lance1)
+        self.assertEqual(leilao.lances, [lance1, lance2])
+
+    @freeze_time("2025-05-23 12:00:00")
     def test_leilao_representacao_string(self):
         leilao = Leilao("Console X", 150.0, self.amanha, self.depois_amanha)
         self.assertEqual(str(leilao), "Leilão(Nome: Console X, Estado: INATIVO, Lances: 0)")
@@ -410,9 +488,16 @@ class TestLeilao(unittest.TestCase):
                          f"data_inicio={self.amanha!r}, data_termino={self.depois_amanha!r})")
         self.assertEqual(repr(leilao), expected_repr)
 
+    def test_instancias_sem_dict(self):
+        # Participante, Lance e Leilao usam __slots__: nenhum atributo fora dos declarados
+        leilao = Leilao("Slots", 10.0, self.amanha, self.depois_amanha)
+        for objeto in (self.participante1, Lance(self.participante1, 10.0), leilao):
+            with self.subTest(tipo=type(objeto).__name__):
+                self.assertFalse(hasattr(objeto, "__dict__"))
+                with self.assertRaises(AttributeError):
+                    objeto.atributo_extra = 1
+
 if __name__ == '__main__':
     # Para executar os testes diretamente deste arquivo (útil para debug)
-    # Adiciona o diretório pai (leilao_system) ao path para encontrar 'src'
-    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
     unittest.main()
 
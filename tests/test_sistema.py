@@ -1,41 +1,124 @@
 import unittest
-from datetime import date, datetime, timedelta, time
-import sys
 import os
+import sys
+from datetime import date, datetime, timedelta, time
 from io import StringIO
-from unittest.mock import patch, MagicMock, PropertyMock
+from contextlib import ExitStack, contextmanager, redirect_stdout
 import re
+from typing import Final
 
-# Imports absolutos a partir da raiz do projeto
+# Imports absolutos a partir da raiz do projeto (também na execução direta do arquivo)
 current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.abspath(os.path.join(current_dir, os.pardir))
-sys.path.insert(0, project_root)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from src.sistema import SistemaLeiloes
-from src.models import Participante, Leilao, EstadoLeilao, Lance
+from src.models import Participante, EstadoLeilao, Lance
 from src.exceptions import ParticipanteInvalido, LeilaoInvalido, LanceInvalido
-from freezegun import freeze_time # type: ignore
+import time_machine # type: ignore
+# time-machine trata datetimes ingênuos como UTC: os instantes dos testes são
+# convertidos para o fuso local com `astimezone()` antes de `travel`/`move_to`
+
+# Padrões de mensagens de erro compilados uma única vez para todo o módulo
+_RE_CPF_DUPLICADO = re.compile(r"CPF 11111111111 já cadastrado\.")
+_RE_EMAIL_DUPLICADO = re.compile(r"Email alice@test\.com já cadastrado\.")
+_RE_PARTICIPANTE_INEXISTENTE = re.compile(r"Participante com CPF 99999999999 não encontrado\.")
+_RE_PARTICIPANTE_COM_LANCES = re.compile(r"Participante Alice .* não pode ser excluído pois possui lances registrados\.")
+_RE_LEILAO_ITEMDUP_EXISTENTE = re.compile(r"Já existe um leilão com o nome 'ItemDup'\.")
+_RE_LEILAO_LEILAO2_EXISTENTE = re.compile(r"Já existe um leilão com o nome 'Leilao2'\.")
+_RE_ALTERAR_ABERTO = re.compile(r"Leilão 'Aberto' não pode ser alterado \(Estado: ABERTO\)")
+_RE_ALTERAR_FINALIZADO = re.compile(r"Leilão 'Finalizado' não pode ser alterado \(Estado: FINALIZADO\)")
+_RE_EXCLUIR_ABERTO = re.compile(r"Leilão 'AbertoExcluir' não pode ser excluído \(Estado: ABERTO\)")
+_RE_EXCLUIR_FINALIZADO = re.compile(r"Leilão 'FinalizadoExcluir' não pode ser excluído \(Estado: FINALIZADO\)")
+_RE_LEILAO_INEXISTENTE = re.compile(r"Leilão com nome 'Inexistente' não encontrado\.")
+_RE_LEILAO_INEXISTENTE_NOTIFICACAO = re.compile(r"Leilão com nome 'Inexistente' não encontrado para notificação\.")
+_RE_LEILAO_INATIVO = re.compile(r"não está ABERTO para receber lances \(Estado: INATIVO\)")
+_RE_LANCE_NAO_MAIOR = re.compile(r"valor \(R\$ 55\.00\) não é maior que o último lance \(R\$ 60\.00\)")
+_RE_LANCES_SEGUIDOS = re.compile(r"participante não pode dar dois lances seguidos")
+_RE_VALOR_LANCE_INVALIDO = re.compile(r"O valor do lance deve ser positivo")
+_RE_NOVO_NOME_INVALIDO = re.compile(r"Novo nome do leilão inválido\.")
+_RE_NOVO_LANCE_MINIMO_INVALIDO = re.compile(r"Novo lance mínimo deve ser positivo\.")
+_RE_NOVAS_DATAS_NAO_DATETIME = re.compile(r"Novas datas de início e término devem ser objetos datetime\.")
+_RE_NOVAS_DATAS_FORA_DE_ORDEM = re.compile(r"Nova data de início deve ser anterior à nova data de término\.")
+
+# Saídas esperadas de notificar_ganhador, montadas uma única vez para todo o módulo
+_SAIDA_EMAIL_GANHADOR: Final[str] = (
+    "--- SIMULAÇÃO DE EMAIL ---\n"
+    "Para: bob@test.com\n"
+    "Assunto: Parabéns! Você venceu o leilão 'LeilaoNotifica'\n"
+    "Prezado(a) Bob,\n"
+    "Parabéns! Você arrematou o item 'LeilaoNotifica' com o lance de R$ 70.00.\n"
+    "Detalhes do Leilão:\n"
+    " - Nome: LeilaoNotifica\n"
+    " - Data de Término: 22/05/2025 12:00:00\n"
+    "Em breve entraremos em contato com mais informações.\n"
+    "Atenciosamente,\n"
+    "Equipe Leilão System\n"
+    "--------------------------\n"
+)
+_SAIDA_INFO_ABERTO: Final[str] = "INFO: Leilão 'AbertoNotifica' ainda não foi finalizado (Estado: ABERTO). Nenhuma notificação enviada.\n"
+_SAIDA_INFO_EXPIRADO: Final[str] = "INFO: Leilão 'ExpiradoNotifica' ainda não foi finalizado (Estado: EXPIRADO). Nenhuma notificação enviada.\n"
+_LOG_SEM_GANHADOR: Final[str] = "WARNING:leilao:Leilão 'FinalizadoInconsistente' está FINALIZADO mas não possui ganhador definido."
+_LOG_SEM_MAIOR_LANCE: Final[str] = "WARNING:leilao:Leilão 'FinalizadoInconsistente' tem ganhador mas não foi possível obter o maior lance."
+
+@contextmanager
+def _sobrescrever_propriedade(objeto, nome, valor):
+    """Faz a propriedade `nome` de `objeto` retornar `valor` dentro do bloco.
+
+    Troca temporariamente a classe do objeto por uma subclasse (sem `__dict__`,
+    compatível com `__slots__`) que redefine apenas essa propriedade.
+    """
+    classe_original = objeto.__class__
+    objeto.__class__ = type(f"_{classe_original.__name__}Sobrescrito", (classe_original,),
+                            {"__slots__": (), nome: property(lambda self: valor)})
+    try:
+        yield objeto
+    finally:
+        objeto.__class__ = classe_original
 
 class TestSistemaLeiloes(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        """Calcula uma única vez as datas de referência (valores imutáveis)."""
+        cls.tempo_base = datetime(2025, 5, 23, 12, 0, 0)
+        cls.agora_dt = cls.tempo_base
+        cls.amanha_dt = cls.tempo_base + timedelta(days=1)
+        cls.ontem_dt = cls.tempo_base - timedelta(days=1)
+        cls.depois_amanha_dt = cls.tempo_base + timedelta(days=2)
+        cls.anteontem_dt = cls.tempo_base - timedelta(days=2)
+        cls.hoje = cls.tempo_base.date()
+        cls.amanha = cls.hoje + timedelta(days=1)
+        cls.ontem = cls.hoje - timedelta(days=1)
+        cls.depois_amanha = cls.hoje + timedelta(days=2)
+        cls.anteontem = cls.hoje - timedelta(days=2)
+
     def setUp(self):
-        """Configura um ambiente limpo para cada teste."""
+        """Configura um sistema limpo, com dois participantes, para cada teste."""
         self.sistema = SistemaLeiloes()
-        self.tempo_base = datetime(2025, 5, 23, 12, 0, 0)
-        self.agora_dt = self.tempo_base
-        self.amanha_dt = self.tempo_base + timedelta(days=1)
-        self.ontem_dt = self.tempo_base - timedelta(days=1)
-        self.depois_amanha_dt = self.tempo_base + timedelta(days=2)
-        self.anteontem_dt = self.tempo_base - timedelta(days=2)
-        self.hoje = self.tempo_base.date()
-        self.amanha = self.hoje + timedelta(days=1)
-        self.ontem = self.hoje - timedelta(days=1)
-        self.depois_amanha = self.hoje + timedelta(days=2)
-        self.anteontem = self.hoje - timedelta(days=2)
-
         self.p1 = self.sistema.cadastrar_participante("Alice", "11111111111", "alice@test.com", date(1991, 1, 1))
         self.p2 = self.sistema.cadastrar_participante("Bob", "22222222222", "bob@test.com", date(1992, 2, 2))
 
+    def _leilao_finalizado_com_lances(self, nome, lance_minimo, inicio, fim, lances):
+        """Cadastra um leilão, registra os lances e o leva a FINALIZADO.
+
+        Um único relógio congelado é deslocado com `move_to` entre as fases:
+        antes do início (cadastro), uma hora após o início (lances) e uma hora
+        após o término (finalização). Os instantes são convertidos para datetimes
+        locais com fuso (`astimezone`), pois o time-machine trata datetimes ingênuos como UTC.
+        """
+        with time_machine.travel((inicio - timedelta(hours=1)).astimezone(), tick=False) as viajante:
+            leilao = self.sistema.cadastrar_leilao(nome, lance_minimo, inicio, fim)
+            self.assertEqual(leilao.estado, EstadoLeilao.INATIVO, "Deveria ser INATIVO antes do início")
+            viajante.move_to((inicio + timedelta(hours=1)).astimezone())
+            self.assertEqual(leilao.estado, EstadoLeilao.ABERTO, "Leilão deveria estar ABERTO para receber lances")
+            for participante, valor in lances:
+                self.sistema.propor_lance_sistema(participante.cpf, nome, valor)
+            viajante.move_to((fim + timedelta(hours=1)).astimezone())
+            self.assertEqual(leilao.estado, EstadoLeilao.FINALIZADO, "Leilão deveria estar FINALIZADO após o término com lance")
+        return leilao
+
     # --- Testes de Participantes ---
     def test_cadastrar_participante_sucesso(self):
         p3 = self.sistema.cadastrar_participante("Charlie", "33333333333", "charlie@test.com", date(1993, 3, 3))
@@ -44,11 +127,11 @@ class TestSistemaLeiloes(unittest.TestCase):
         self.assertEqual(len(self.sistema.participantes), 3)
 
     def test_cadastrar_participante_cpf_duplicado(self):
-        with self.assertRaisesRegex(ParticipanteInvalido, "CPF 11111111111 já cadastrado."):
+        with self.assertRaisesRegex(ParticipanteInvalido, _RE_CPF_DUPLICADO):
             self.sistema.cadastrar_participante("Alice Duplicada", "111.111.111-11", "alice.dup@test.com", date(1991, 1, 1))
 
     def test_cadastrar_participante_email_duplicado(self):
-        with self.assertRaisesRegex(ParticipanteInvalido, "Email alice@test.com já cadastrado."):
+        with self.assertRaisesRegex(ParticipanteInvalido, _RE_EMAIL_DUPLICADO):
             self.sistema.cadastrar_participante("Alice Email Dup", "44444444444", "alice@test.com", date(1994, 4, 4))
 
     def test_buscar_participante_existente(self):
@@ -70,24 +153,19 @@ class TestSistemaLeiloes(unittest.TestCase):
         self.assertIsNone(self.sistema.buscar_participante_por_cpf(cpf_p1))
         self.assertEqual(len(self.sistema.participantes), 1)
 
+    def test_excluir_participante_libera_email(self):
+        self.sistema.excluir_participante(self.p1.cpf)
+        p3 = self.sistema.cadastrar_participante("Alice Nova", "33333333333", "alice@test.com", date(1993, 3, 3))
+        self.assertEqual(self.sistema.buscar_participante_por_cpf("33333333333"), p3)
+
     def test_excluir_participante_inexistente(self):
-        cpf_inexistente = "99999999999"
-        with self.assertRaisesRegex(ParticipanteInvalido, f"Participante com CPF {cpf_inexistente} não encontrado."):
-            self.sistema.excluir_participante(cpf_inexistente)
+        with self.assertRaisesRegex(ParticipanteInvalido, _RE_PARTICIPANTE_INEXISTENTE):
+            self.sistema.excluir_participante("99999999999")
 
     def test_excluir_participante_com_lances(self):
-        inicio_leilao = datetime(2025, 5, 22, 12, 0, 0)
-        fim_leilao = datetime(2025, 5, 24, 12, 0, 0)
-        tempo_lance = datetime(2025, 5, 23, 12, 0, 0)
-        leilao = self.sistema.cadastrar_leilao("Leilao Teste", 10, inicio_leilao, fim_leilao)
-        with freeze_time(inicio_leilao - timedelta(hours=1)):
-            leilao.atualizar_estado()
-            self.assertEqual(leilao.estado, EstadoLeilao.INATIVO)
-        with freeze_time(tempo_lance):
-            leilao.atualizar_estado()
-            self.assertEqual(leilao.estado, EstadoLeilao.ABERTO)
-            self.sistema.propor_lance_sistema(self.p1.cpf, "Leilao Teste", 20)
-        with self.assertRaisesRegex(ParticipanteInvalido, f"Participante {self.p1.nome} .* não pode ser excluído pois possui lances registrados."):
+        self._leilao_finalizado_com_lances("Leilao Teste", 10, datetime(2025, 5, 22, 12, 0, 0), datetime(2025, 5, 24, 12, 0, 0),
+                                           [(self.p1, 20)])
+        with self.assertRaisesRegex(ParticipanteInvalido, _RE_PARTICIPANTE_COM_LANCES):
             self.sistema.excluir_participante(self.p1.cpf)
         self.assertIn(self.p1.cpf, self.sistema._participantes)
 
@@ -96,16 +174,35 @@ class TestSistemaLeiloes(unittest.TestCase):
         self.assertEqual(len(participantes), 2)
         self.assertIn(self.p1, participantes)
         self.assertIn(self.p2, participantes)
+        # A lista é uma cópia: pode-se excluir participantes enquanto se itera sobre ela
+        for participante in self.sistema.participantes:
+            self.sistema.excluir_participante(participante.cpf)
+        self.assertEqual(self.sistema.participantes, [])
+        self.assertEqual(participantes, [self.p1, self.p2])
 
     # --- Testes de Leilões ---
     def test_cadastrar_leilao_sucesso(self):
         leilao = self.sistema.cadastrar_leilao("Notebook", 1500, self.amanha_dt, self.depois_amanha_dt)
-        self.assertIn(leilao, self.sistema._leiloes)
+        self.assertIn(leilao, self.sistema._leiloes.values())
         self.assertEqual(self.sistema.buscar_leilao_por_nome("Notebook"), leilao)
 
+    def test_cadastrar_leilao_interna_nome(self):
+        nome = "".join(["Leilao", "Internado"]) # String criada em tempo de execução
+        leilao = self.sistema.cadastrar_leilao(nome, 100, self.amanha_dt, self.depois_amanha_dt)
+        self.assertIs(leilao.nome, sys.intern("LeilaoInternado"))
+        self.assertIs(self.sistema.buscar_leilao_por_nome("LeilaoInternado"), leilao)
+
+    def test_cadastrar_e_alterar_leilao_nome_subclasse_de_str(self):
+        class Nome(str):
+            pass
+        leilao = self.sistema.cadastrar_leilao(Nome("Subclasse"), 100, self.amanha_dt, self.depois_amanha_dt)
+        self.assertIs(self.sistema.buscar_leilao_por_nome("Subclasse"), leilao)
+        self.sistema.alterar_leilao("Subclasse", novo_nome=Nome("Renomeado"))
+        self.assertIs(self.sistema.buscar_leilao_por_nome("Renomeado"), leilao)
+
     def test_cadastrar_leilao_nome_duplicado(self):
         self.sistema.cadastrar_leilao("ItemDup", 100, self.amanha_dt, self.depois_amanha_dt)
-        with self.assertRaisesRegex(LeilaoInvalido, r"Já existe um leilão com o nome \'ItemDup\'."):
+        with self.assertRaisesRegex(LeilaoInvalido, _RE_LEILAO_ITEMDUP_EXISTENTE):
             self.sistema.cadastrar_leilao("ItemDup", 200, self.amanha_dt, self.depois_amanha_dt)
 
     def test_buscar_leilao_existente(self):
@@ -114,8 +211,10 @@ class TestSistemaLeiloes(unittest.TestCase):
 
     def test_buscar_leilao_inexistente(self):
         self.assertIsNone(self.sistema.buscar_leilao_por_nome("Inexistente"))
+        self.sistema.cadastrar_leilao("Existente", 100, self.amanha_dt, self.depois_amanha_dt)
+        self.assertIsNone(self.sistema.buscar_leilao_por_nome(["Existente"])) # Chave não hasheável
 
-    @freeze_time("2025-05-23 10:00:00")
+    @time_machine.travel("2025-05-23 10:00:00", tick=False)
     def test_alterar_leilao_inativo_sucesso(self):
         leilao = self.sistema.cadastrar_leilao("Original", 100, datetime(2025, 5, 24, 12, 0, 0), datetime(2025, 5, 25, 12, 0, 0))
         leilao.atualizar_estado()
@@ -127,7 +226,15 @@ class TestSistemaLeiloes(unittest.TestCase):
         self.assertEqual(leilao_alterado.data_inicio, datetime(2025, 5, 24, 14, 0, 0))
         self.assertIsNone(self.sistema.buscar_leilao_por_nome("Original"))
 
-    @freeze_time("2025-05-23 10:00:00")
+    @time_machine.travel("2025-05-23 10:00:00", tick=False)
+    def test_alterar_leilao_novo_nome_libera_nome_antigo(self):
+        leilao = self.sistema.cadastrar_leilao("Antigo", 100, self.amanha_dt, self.depois_amanha_dt)
+        self.sistema.alterar_leilao("Antigo", novo_nome="Renomeado")
+        self.assertIs(self.sistema.buscar_leilao_por_nome("Renomeado"), leilao)
+        novo = self.sistema.cadastrar_leilao("Antigo", 200, self.amanha_dt, self.depois_amanha_dt)
+        self.assertIs(self.sistema.buscar_leilao_por_nome("Antigo"), novo)
+
+    @time_machine.travel("2025-05-23 10:00:00", tick=False)
     def test_alterar_leilao_expirado_sucesso(self):
         leilao = self.sistema.cadastrar_leilao("Expirado", 50, datetime(2025, 5, 21, 10, 0, 0), datetime(2025, 5, 22, 10, 0, 0))
         leilao.atualizar_estado()
@@ -135,120 +242,99 @@ class TestSistemaLeiloes(unittest.TestCase):
         self.sistema.alterar_leilao("Expirado", novo_lance_minimo=60)
         self.assertEqual(leilao.lance_minimo, 60)
 
-    @freeze_time("2025-05-23 10:00:00")
+    @time_machine.travel("2025-05-23 10:00:00", tick=False)
+    def test_alterar_leilao_expirado_novas_datas_reativa(self):
+        # EXPIRADO não é terminal: com novas datas o estado é recalculado
+        leilao = self.sistema.cadastrar_leilao("Reagendado", 50, self.anteontem_dt, self.ontem_dt)
+        self.assertEqual(leilao.estado, EstadoLeilao.EXPIRADO)
+        self.sistema.alterar_leilao("Reagendado", nova_data_inicio=self.amanha_dt, nova_data_termino=self.depois_amanha_dt)
+        self.assertEqual(leilao.estado, EstadoLeilao.INATIVO)
+
+    @time_machine.travel("2025-05-23 10:00:00", tick=False)
     def test_alterar_leilao_aberto_falha(self):
         leilao = self.sistema.cadastrar_leilao("Aberto", 50, datetime(2025, 5, 22, 10, 0, 0), datetime(2025, 5, 24, 10, 0, 0))
         leilao.atualizar_estado()
         self.assertEqual(leilao.estado, EstadoLeilao.ABERTO)
-        with self.assertRaisesRegex(LeilaoInvalido, r"Leilão \'Aberto\' não pode ser alterado \(Estado: ABERTO\)"):
+        with self.assertRaisesRegex(LeilaoInvalido, _RE_ALTERAR_ABERTO):
             self.sistema.alterar_leilao("Aberto", novo_lance_minimo=60)
 
     def test_alterar_leilao_finalizado_falha(self):
-        inicio_leilao = datetime(2025, 5, 21, 10, 0, 0)
-        fim_leilao = datetime(2025, 5, 22, 10, 0, 0)
-        tempo_lance = datetime(2025, 5, 21, 11, 0, 0)
-        with freeze_time(inicio_leilao - timedelta(hours=1)):
-            leilao = self.sistema.cadastrar_leilao("Finalizado", 50, inicio_leilao, fim_leilao)
-            self.assertEqual(leilao.estado, EstadoLeilao.INATIVO, "Deveria ser INATIVO antes do início")
-        with freeze_time(tempo_lance):
-            leilao = self.sistema.buscar_leilao_por_nome("Finalizado")
-            leilao.atualizar_estado()
-            self.assertEqual(leilao.estado, EstadoLeilao.ABERTO, "Leilão deveria estar ABERTO para receber lance")
-            self.sistema.propor_lance_sistema(self.p1.cpf, "Finalizado", 60)
-        with freeze_time(fim_leilao + timedelta(hours=1)):
-            leilao = self.sistema.buscar_leilao_por_nome("Finalizado")
-            leilao.atualizar_estado()
-            self.assertEqual(leilao.estado, EstadoLeilao.FINALIZADO, "Leilão deveria estar FINALIZADO após o término com lance")
-            with self.assertRaisesRegex(LeilaoInvalido, r"Leilão \'Finalizado\' não pode ser alterado \(Estado: FINALIZADO\)"):
-                self.sistema.alterar_leilao("Finalizado", novo_lance_minimo=70)
+        self._leilao_finalizado_com_lances("Finalizado", 50, datetime(2025, 5, 21, 10, 0, 0), datetime(2025, 5, 22, 10, 0, 0),
+                                           [(self.p1, 60)])
+        with self.assertRaisesRegex(LeilaoInvalido, _RE_ALTERAR_FINALIZADO):
+            self.sistema.alterar_leilao("Finalizado", novo_lance_minimo=70)
 
     def test_alterar_leilao_inexistente(self):
-        with self.assertRaisesRegex(LeilaoInvalido, r"Leilão com nome \'Inexistente\' não encontrado."):
+        with self.assertRaisesRegex(LeilaoInvalido, _RE_LEILAO_INEXISTENTE):
             self.sistema.alterar_leilao("Inexistente", novo_nome="NovoNome")
 
     def test_alterar_leilao_novo_nome_duplicado(self):
         l1 = self.sistema.cadastrar_leilao("Leilao1", 100, self.amanha_dt, self.depois_amanha_dt)
         l2 = self.sistema.cadastrar_leilao("Leilao2", 200, self.amanha_dt, self.depois_amanha_dt)
-        with self.assertRaisesRegex(LeilaoInvalido, r"Já existe um leilão com o nome \'Leilao2\'."):
+        with self.assertRaisesRegex(LeilaoInvalido, _RE_LEILAO_LEILAO2_EXISTENTE):
             self.sistema.alterar_leilao("Leilao1", novo_nome="Leilao2")
 
     # Testes para cobrir linhas 95 e 99 de sistema.py
     def test_alterar_leilao_dados_invalidos_extras(self):
-        leilao = self.sistema.cadastrar_leilao("ParaAlterarInv", 100, self.amanha_dt, self.depois_amanha_dt)
-        with self.assertRaisesRegex(ValueError, "Novo nome do leilão inválido."):
-            self.sistema.alterar_leilao("ParaAlterarInv", novo_nome="") # Nome vazio
-        # O caso novo_nome=None não deve levantar erro, pois significa não alterar
-        # with self.assertRaisesRegex(ValueError, "Novo nome do leilão inválido."):
-        #     self.sistema.alterar_leilao("ParaAlterarInv", novo_nome=None) # Nome None
-        with self.assertRaisesRegex(ValueError, "Novo nome do leilão inválido."):
-            self.sistema.alterar_leilao("ParaAlterarInv", novo_nome=123) # Nome não string
-
-        with self.assertRaisesRegex(ValueError, "Novo lance mínimo deve ser positivo."):
-            self.sistema.alterar_leilao("ParaAlterarInv", novo_lance_minimo="abc") # Lance não numérico
-        with self.assertRaisesRegex(ValueError, "Novo lance mínimo deve ser positivo."):
-            self.sistema.alterar_leilao("ParaAlterarInv", novo_lance_minimo=-50) # Lance negativo
-        with self.assertRaisesRegex(ValueError, "Novo lance mínimo deve ser positivo."):
-            self.sistema.alterar_leilao("ParaAlterarInv", novo_lance_minimo=0) # Lance zero
-
-        with self.assertRaisesRegex(ValueError, "Novas datas de início e término devem ser objetos datetime."):
-            self.sistema.alterar_leilao("ParaAlterarInv", nova_data_inicio="data invalida")
-        # O caso nova_data_termino=None não deve levantar erro, pois significa não alterar
-        # with self.assertRaisesRegex(ValueError, "Novas datas de início e término devem ser objetos datetime."):
-        #     self.sistema.alterar_leilao("ParaAlterarInv", nova_data_termino=None)
-
-        with self.assertRaisesRegex(ValueError, "Nova data de início deve ser anterior à nova data de término."):
-            self.sistema.alterar_leilao("ParaAlterarInv", nova_data_inicio=self.depois_amanha_dt, nova_data_termino=self.amanha_dt)
-
-    @freeze_time("2025-05-23 10:00:00")
+        self.sistema.cadastrar_leilao("ParaAlterarInv", 100, self.amanha_dt, self.depois_amanha_dt)
+        # novo_nome=None e nova_data_termino=None não levantam erro, pois significam não alterar
+        casos = (
+            ({"novo_nome": ""}, _RE_NOVO_NOME_INVALIDO), # Nome vazio
+            ({"novo_nome": 123}, _RE_NOVO_NOME_INVALIDO), # Nome não string
+            ({"novo_nome": ["Lista"]}, _RE_NOVO_NOME_INVALIDO), # Nome não hasheável
+            ({"novo_lance_minimo": "abc"}, _RE_NOVO_LANCE_MINIMO_INVALIDO), # Lance não numérico
+            ({"novo_lance_minimo": -50}, _RE_NOVO_LANCE_MINIMO_INVALIDO), # Lance negativo
+            ({"novo_lance_minimo": 0}, _RE_NOVO_LANCE_MINIMO_INVALIDO), # Lance zero
+            ({"nova_data_inicio": "data invalida"}, _RE_NOVAS_DATAS_NAO_DATETIME),
+            ({"nova_data_inicio": self.depois_amanha_dt, "nova_data_termino": self.amanha_dt},
+             _RE_NOVAS_DATAS_FORA_DE_ORDEM),
+        )
+        for kwargs, padrao in casos:
+            with self.subTest(**kwargs):
+                with self.assertRaisesRegex(ValueError, padrao):
+                    self.sistema.alterar_leilao("ParaAlterarInv", **kwargs)
+
+    @time_machine.travel("2025-05-23 10:00:00", tick=False)
     def test_excluir_leilao_inativo_sucesso(self):
         leilao = self.sistema.cadastrar_leilao("ParaExcluir", 100, self.amanha_dt, self.depois_amanha_dt)
         leilao.atualizar_estado()
         self.assertEqual(leilao.estado, EstadoLeilao.INATIVO)
         self.sistema.excluir_leilao("ParaExcluir")
-        self.assertNotIn(leilao, self.sistema._leiloes)
+        self.assertNotIn(leilao, self.sistema._leiloes.values())
         self.assertIsNone(self.sistema.buscar_leilao_por_nome("ParaExcluir"))
 
-    @freeze_time("2025-05-23 10:00:00")
+    @time_machine.travel("2025-05-23 10:00:00", tick=False)
     def test_excluir_leilao_expirado_sucesso(self):
         leilao = self.sistema.cadastrar_leilao("ExpiradoExcluir", 50, self.anteontem_dt, self.ontem_dt)
         leilao.atualizar_estado()
         self.assertEqual(leilao.estado, EstadoLeilao.EXPIRADO)
         self.sistema.excluir_leilao("ExpiradoExcluir")
-        self.assertNotIn(leilao, self.sistema._leiloes)
+        self.assertNotIn(leilao, self.sistema._leiloes.values())
 
-    @freeze_time("2025-05-23 10:00:00")
+    @time_machine.travel("2025-05-23 10:00:00", tick=False)
     def test_excluir_leilao_aberto_falha(self):
         leilao = self.sistema.cadastrar_leilao("AbertoExcluir", 50, self.ontem_dt, self.amanha_dt)
         leilao.atualizar_estado()
         self.assertEqual(leilao.estado, EstadoLeilao.ABERTO)
-        with self.assertRaisesRegex(LeilaoInvalido, r"Leilão \'AbertoExcluir\' não pode ser excluído \(Estado: ABERTO\)"):
+        with self.assertRaisesRegex(LeilaoInvalido, _RE_EXCLUIR_ABERTO):
             self.sistema.excluir_leilao("AbertoExcluir")
-        self.assertIn(leilao, self.sistema._leiloes)
+        self.assertIn(leilao, self.sistema._leiloes.values())
 
     def test_excluir_leilao_finalizado_falha(self):
-        inicio_leilao = self.anteontem_dt
-        fim_leilao = self.ontem_dt
-        tempo_lance = inicio_leilao + timedelta(hours=1)
-        with freeze_time(inicio_leilao - timedelta(hours=1)):
-            leilao = self.sistema.cadastrar_leilao("FinalizadoExcluir", 50, inicio_leilao, fim_leilao)
-            self.assertEqual(leilao.estado, EstadoLeilao.INATIVO, "Deveria ser INATIVO antes do início")
-        with freeze_time(tempo_lance):
-            leilao = self.sistema.buscar_leilao_por_nome("FinalizadoExcluir")
-            leilao.atualizar_estado()
-            self.assertEqual(leilao.estado, EstadoLeilao.ABERTO, "Leilão deveria estar ABERTO para receber lance")
-            self.sistema.propor_lance_sistema(self.p1.cpf, "FinalizadoExcluir", 60)
-        with freeze_time(fim_leilao + timedelta(hours=1)):
-            leilao = self.sistema.buscar_leilao_por_nome("FinalizadoExcluir")
-            leilao.atualizar_estado()
-            self.assertEqual(leilao.estado, EstadoLeilao.FINALIZADO, "Leilão deveria estar FINALIZADO após o término com lance")
-            with self.assertRaisesRegex(LeilaoInvalido, r"Leilão \'FinalizadoExcluir\' não pode ser excluído \(Estado: FINALIZADO\)"):
-                self.sistema.excluir_leilao("FinalizadoExcluir")
-            self.assertIn(leilao, self.sistema._leiloes)
+        leilao = self._leilao_finalizado_com_lances("FinalizadoExcluir", 50, self.anteontem_dt, self.ontem_dt,
+                                                    [(self.p1, 60)])
+        with self.assertRaisesRegex(LeilaoInvalido, _RE_EXCLUIR_FINALIZADO):
+            self.sistema.excluir_leilao("FinalizadoExcluir")
+        self.assertIn(leilao, self.sistema._leiloes.values())
 
     def test_excluir_leilao_inexistente(self):
-        with self.assertRaisesRegex(LeilaoInvalido, r"Leilão com nome \'Inexistente\' não encontrado."):
+        with self.assertRaisesRegex(LeilaoInvalido, _RE_LEILAO_INEXISTENTE):
             self.sistema.excluir_leilao("Inexistente")
 
+    def test_listar_leiloes_sistema_vazio(self):
+        self.assertEqual(self.sistema.listar_leiloes(), [])
+        self.assertEqual(self.sistema.listar_leiloes(estado=EstadoLeilao.ABERTO, data_inicio_intervalo=self.hoje), [])
+
     def test_listar_leiloes_sem_filtro(self):
         agora = datetime(2025, 5, 23, 10, 0, 0)
         amanha = agora + timedelta(days=1)
@@ -259,23 +345,13 @@ class TestSistemaLeiloes(unittest.TestCase):
         l1 = self.sistema.cadastrar_leilao("L1_Inativo", 10, amanha, depois_amanha)
         l2 = self.sistema.cadastrar_leilao("L2_Aberto", 10, ontem, amanha)
         l3 = self.sistema.cadastrar_leilao("L3_Expirado", 10, anteontem, ontem)
-        l4_dt_inicio = tres_dias_atras
-        l4_dt_fim = anteontem
-        with freeze_time(l4_dt_inicio - timedelta(hours=1)):
-            l4 = self.sistema.cadastrar_leilao("L4_Finalizado", 10, l4_dt_inicio, l4_dt_fim)
-            self.assertEqual(l4.estado, EstadoLeilao.INATIVO, "L4 deveria ser INATIVO antes do início")
-        with freeze_time(l4_dt_inicio + timedelta(hours=1)):
-             l4 = self.sistema.buscar_leilao_por_nome("L4_Finalizado")
-             l4.atualizar_estado()
-             self.assertEqual(l4.estado, EstadoLeilao.ABERTO, "L4 deveria estar ABERTO para receber lance")
-             self.sistema.propor_lance_sistema(self.p1.cpf, "L4_Finalizado", 15)
-        with freeze_time(agora):
+        self._leilao_finalizado_com_lances("L4_Finalizado", 10, tres_dias_atras, anteontem, [(self.p1, 15)])
+        with time_machine.travel(agora.astimezone(), tick=False):
             l1_atual = self.sistema.buscar_leilao_por_nome("L1_Inativo")
             l2_atual = self.sistema.buscar_leilao_por_nome("L2_Aberto")
             l3_atual = self.sistema.buscar_leilao_por_nome("L3_Expirado")
             l4_atual = self.sistema.buscar_leilao_por_nome("L4_Finalizado")
-            for leilao in [l1_atual, l2_atual, l3_atual, l4_atual]:
-                 if leilao: leilao.atualizar_estado()
+            self.sistema.atualizar_todos_estados()
             lista = self.sistema.listar_leiloes()
             self.assertEqual(len(lista), 4)
             self.assertIn(l1_atual, lista)
@@ -287,24 +363,29 @@ class TestSistemaLeiloes(unittest.TestCase):
             self.assertEqual(l3_atual.estado, EstadoLeilao.EXPIRADO)
             self.assertEqual(l4_atual.estado, EstadoLeilao.FINALIZADO, "L4 deveria estar FINALIZADO agora")
 
-    @freeze_time("2025-05-23 10:00:00")
+    @time_machine.travel("2025-05-23 10:00:00", tick=False)
     def test_listar_leiloes_filtro_estado(self):
         l1 = self.sistema.cadastrar_leilao("L1_Inativo", 10, self.amanha_dt, self.depois_amanha_dt)
         l2 = self.sistema.cadastrar_leilao("L2_Aberto", 10, self.ontem_dt, self.amanha_dt)
         l3 = self.sistema.cadastrar_leilao("L3_Expirado", 10, self.anteontem_dt, self.ontem_dt)
-        for leilao in self.sistema._leiloes: leilao.atualizar_estado()
-        self.assertEqual(self.sistema.listar_leiloes(estado=EstadoLeilao.INATIVO), [l1])
-        self.assertEqual(self.sistema.listar_leiloes(estado=EstadoLeilao.ABERTO), [l2])
-        self.assertEqual(self.sistema.listar_leiloes(estado=EstadoLeilao.EXPIRADO), [l3])
-        self.assertEqual(self.sistema.listar_leiloes(estado=EstadoLeilao.FINALIZADO), [])
-
-    @freeze_time("2025-05-23 12:00:00")
+        self.sistema.atualizar_todos_estados()
+        casos = (
+            (EstadoLeilao.INATIVO, [l1]),
+            (EstadoLeilao.ABERTO, [l2]),
+            (EstadoLeilao.EXPIRADO, [l3]),
+            (EstadoLeilao.FINALIZADO, []),
+        )
+        for estado, esperado in casos:
+            with self.subTest(estado=estado.name):
+                self.assertEqual(self.sistema.listar_leiloes(estado=estado), esperado)
+
+    @time_machine.travel("2025-05-23 12:00:00", tick=False)
     def test_listar_leiloes_filtro_data(self):
         l1 = self.sistema.cadastrar_leilao("L1", 10, datetime(2025, 5, 24, 12, 0), datetime(2025, 5, 25, 12, 0))
         l2 = self.sistema.cadastrar_leilao("L2", 10, datetime(2025, 5, 22, 12, 0), datetime(2025, 5, 24, 12, 0))
         l3 = self.sistema.cadastrar_leilao("L3", 10, datetime(2025, 5, 21, 12, 0), datetime(2025, 5, 22, 12, 0))
         l4 = self.sistema.cadastrar_leilao("L4", 10, datetime(2025, 5, 20, 12, 0), datetime(2025, 5, 21, 12, 0))
-        for leilao in self.sistema._leiloes: leilao.atualizar_estado()
+        self.sistema.atualizar_todos_estados()
         filtro_inicio = date(2025, 5, 22)
         filtro_fim = date(2025, 5, 24)
         lista = self.sistema.listar_leiloes(data_inicio_intervalo=filtro_inicio, data_fim_intervalo=filtro_fim)
@@ -315,19 +396,29 @@ class TestSistemaLeiloes(unittest.TestCase):
         lista_fim = self.sistema.listar_leiloes(data_fim_intervalo=date(2025, 5, 21))
         self.assertCountEqual(lista_fim, [l3, l4])
 
-    @freeze_time("2025-05-23 12:00:00")
+    @time_machine.travel("2025-05-23 12:00:00", tick=False)
     def test_listar_leiloes_filtro_combinado(self):
         l1 = self.sistema.cadastrar_leilao("L1_Inativo", 10, self.amanha_dt, self.depois_amanha_dt)
         l2 = self.sistema.cadastrar_leilao("L2_Aberto", 10, self.ontem_dt, self.amanha_dt)
         l3 = self.sistema.cadastrar_leilao("L3_Aberto_Antigo", 10, self.anteontem_dt, self.amanha_dt)
-        for leilao in self.sistema._leiloes: leilao.atualizar_estado()
+        self.sistema.atualizar_todos_estados()
         lista = self.sistema.listar_leiloes(estado=EstadoLeilao.ABERTO, data_inicio_intervalo=self.hoje)
         self.assertCountEqual(lista, [l2, l3])
         lista2 = self.sistema.listar_leiloes(estado=EstadoLeilao.ABERTO, data_fim_intervalo=self.amanha)
         self.assertCountEqual(lista2, [l2, l3])
 
+    def test_atualizar_todos_estados_com_instante_informado(self):
+        l1 = self.sistema.cadastrar_leilao("L1", 10, self.ontem_dt, self.amanha_dt)
+        l2 = self.sistema.cadastrar_leilao("L2", 10, self.amanha_dt, self.depois_amanha_dt)
+        self.sistema.atualizar_todos_estados(self.agora_dt)
+        self.assertEqual(l1._estado, EstadoLeilao.ABERTO)
+        self.assertEqual(l2._estado, EstadoLeilao.INATIVO)
+        self.sistema.atualizar_todos_estados(self.depois_amanha_dt + timedelta(hours=1))
+        self.assertEqual(l1._estado, EstadoLeilao.EXPIRADO)
+        self.assertEqual(l2._estado, EstadoLeilao.EXPIRADO)
+
     # --- Testes de Lances via Sistema ---
-    @freeze_time("2025-05-23 10:00:00")
+    @time_machine.travel("2025-05-23 10:00:00", tick=False)
     def test_propor_lance_sistema_sucesso(self):
         leilao = self.sistema.cadastrar_leilao("LeilaoLance", 50, self.ontem_dt, self.amanha_dt)
         leilao.atualizar_estado()
@@ -339,33 +430,62 @@ class TestSistemaLeiloes(unittest.TestCase):
 
     def test_propor_lance_sistema_participante_inexistente(self):
         leilao = self.sistema.cadastrar_leilao("LeilaoLance", 50, self.ontem_dt, self.amanha_dt)
-        with self.assertRaisesRegex(ParticipanteInvalido, "Participante com CPF 99999999999 não encontrado."):
+        with self.assertRaisesRegex(ParticipanteInvalido, _RE_PARTICIPANTE_INEXISTENTE):
             self.sistema.propor_lance_sistema("99999999999", "LeilaoLance", 60)
 
     def test_propor_lance_sistema_leilao_inexistente(self):
-        with self.assertRaisesRegex(LeilaoInvalido, r"Leilão com nome \'Inexistente\' não encontrado."):
+        with self.assertRaisesRegex(LeilaoInvalido, _RE_LEILAO_INEXISTENTE):
             self.sistema.propor_lance_sistema(self.p1.cpf, "Inexistente", 60)
 
-    @freeze_time("2025-05-23 10:00:00")
+    @time_machine.travel("2025-05-23 10:00:00", tick=False)
     def test_propor_lance_sistema_leilao_nao_aberto(self):
         leilao_inativo = self.sistema.cadastrar_leilao("InativoLance", 50, self.amanha_dt, self.depois_amanha_dt)
         leilao_inativo.atualizar_estado()
         self.assertEqual(leilao_inativo.estado, EstadoLeilao.INATIVO)
-        with self.assertRaisesRegex(LeilaoInvalido, r"não está ABERTO para receber lances \(Estado: INATIVO\)"):
+        with self.assertRaisesRegex(LeilaoInvalido, _RE_LEILAO_INATIVO):
             self.sistema.propor_lance_sistema(self.p1.cpf, "InativoLance", 60)
 
-    @freeze_time("2025-05-23 10:00:00")
+    @time_machine.travel("2025-05-23 10:00:00", tick=False)
     def test_propor_lance_sistema_lance_invalido(self):
         leilao = self.sistema.cadastrar_leilao("LeilaoLanceInv", 50, self.ontem_dt, self.amanha_dt)
         leilao.atualizar_estado()
         self.assertEqual(leilao.estado, EstadoLeilao.ABERTO)
         self.sistema.propor_lance_sistema(self.p1.cpf, "LeilaoLanceInv", 60)
-        with self.assertRaisesRegex(LanceInvalido, r"valor \(R\$ 55.00\) não é maior que o último lance \(R\$ 60.00\)"):
+        with self.assertRaisesRegex(LanceInvalido, _RE_LANCE_NAO_MAIOR):
             self.sistema.propor_lance_sistema(self.p2.cpf, "LeilaoLanceInv", 55)
-        with self.assertRaisesRegex(LanceInvalido, "participante não pode dar dois lances seguidos"):
+        with self.assertRaisesRegex(LanceInvalido, _RE_LANCES_SEGUIDOS):
             self.sistema.propor_lance_sistema(self.p1.cpf, "LeilaoLanceInv", 70)
 
-    @freeze_time("2025-05-23 10:00:00")
+    @time_machine.travel("2025-05-23 10:00:00", tick=False)
+    def test_propor_lances_em_lote(self):
+        leilao = self.sistema.cadastrar_leilao("LeilaoLote", 50, self.ontem_dt, self.amanha_dt)
+        self.sistema.cadastrar_leilao("LeilaoLoteInativo", 50, self.amanha_dt, self.depois_amanha_dt)
+        seguido = (self.p1.cpf, "LeilaoLote", 65)
+        sem_participante = ("99999999999", "LeilaoLote", 70)
+        sem_leilao = (self.p2.cpf, "Inexistente", 70)
+        nao_aberto = (self.p2.cpf, "LeilaoLoteInativo", 70)
+        valor_invalido = (self.p2.cpf, "LeilaoLote", -1)
+        aceitos, rejeitados = self.sistema.propor_lances_em_lote([
+            (self.p1.cpf, "LeilaoLote", 60),
+            seguido, sem_participante, sem_leilao, nao_aberto, valor_invalido,
+            (self.p2.cpf, "LeilaoLote", 70),
+        ])
+        self.assertEqual(aceitos, leilao.lances)
+        self.assertEqual([lance.valor for lance in aceitos], [60, 70])
+        esperados = (
+            (seguido, LanceInvalido, _RE_LANCES_SEGUIDOS),
+            (sem_participante, ParticipanteInvalido, _RE_PARTICIPANTE_INEXISTENTE),
+            (sem_leilao, LeilaoInvalido, _RE_LEILAO_INEXISTENTE),
+            (nao_aberto, LeilaoInvalido, _RE_LEILAO_INATIVO),
+            (valor_invalido, ValueError, _RE_VALOR_LANCE_INVALIDO),
+        )
+        self.assertEqual([item for item, _ in rejeitados], [item for item, _, _ in esperados])
+        for (item, erro), (_, tipo, padrao) in zip(rejeitados, esperados):
+            with self.subTest(lance=item):
+                self.assertIsInstance(erro, tipo)
+                self.assertRegex(str(erro), padrao)
+
+    @time_machine.travel("2025-05-23 10:00:00", tick=False)
     def test_listar_lances_leilao_sucesso(self):
         leilao = self.sistema.cadastrar_leilao("LeilaoComLances", 50, self.ontem_dt, self.amanha_dt)
         leilao.atualizar_estado()
@@ -384,10 +504,10 @@ class TestSistemaLeiloes(unittest.TestCase):
         self.assertEqual(self.sistema.listar_lances_leilao("LeilaoSemLances"), [])
 
     def test_listar_lances_leilao_inexistente(self):
-        with self.assertRaisesRegex(LeilaoInvalido, r"Leilão com nome \'Inexistente\' não encontrado."):
+        with self.assertRaisesRegex(LeilaoInvalido, _RE_LEILAO_INEXISTENTE):
             self.sistema.listar_lances_leilao("Inexistente")
 
-    @freeze_time("2025-05-23 10:00:00")
+    @time_machine.travel("2025-05-23 10:00:00", tick=False)
     def test_obter_maior_menor_lance_sucesso(self):
         leilao = self.sistema.cadastrar_leilao("LeilaoMM", 50, self.ontem_dt, self.amanha_dt)
         leilao.atualizar_estado()
@@ -410,31 +530,17 @@ class TestSistemaLeiloes(unittest.TestCase):
         self.assertIsNone(self.sistema.obter_menor_lance_leilao("LeilaoMMVazio"))
 
     def test_obter_maior_menor_lance_leilao_inexistente(self):
-        with self.assertRaisesRegex(LeilaoInvalido, r"Leilão com nome \'Inexistente\' não encontrado."):
+        with self.assertRaisesRegex(LeilaoInvalido, _RE_LEILAO_INEXISTENTE):
             self.sistema.obter_maior_lance_leilao("Inexistente")
-        with self.assertRaisesRegex(LeilaoInvalido, r"Leilão com nome \'Inexistente\' não encontrado."):
+        with self.assertRaisesRegex(LeilaoInvalido, _RE_LEILAO_INEXISTENTE):
             self.sistema.obter_menor_lance_leilao("Inexistente")
 
     def test_obter_ganhador_leilao_finalizado(self):
-        inicio_leilao = self.anteontem_dt
-        fim_leilao = self.ontem_dt
-        tempo_lance = inicio_leilao + timedelta(hours=1)
-        with freeze_time(inicio_leilao - timedelta(hours=1)):
-            leilao = self.sistema.cadastrar_leilao("LeilaoGanhador", 50, inicio_leilao, fim_leilao)
-            self.assertEqual(leilao.estado, EstadoLeilao.INATIVO, "Deveria ser INATIVO antes do início")
-        with freeze_time(tempo_lance):
-            leilao = self.sistema.buscar_leilao_por_nome("LeilaoGanhador")
-            leilao.atualizar_estado()
-            self.assertEqual(leilao.estado, EstadoLeilao.ABERTO, "Leilão deveria estar ABERTO para receber lances")
-            self.sistema.propor_lance_sistema(self.p1.cpf, "LeilaoGanhador", 60)
-            self.sistema.propor_lance_sistema(self.p2.cpf, "LeilaoGanhador", 70)
-        with freeze_time(fim_leilao + timedelta(hours=1)):
-            leilao = self.sistema.buscar_leilao_por_nome("LeilaoGanhador")
-            leilao.atualizar_estado()
-            self.assertEqual(leilao.estado, EstadoLeilao.FINALIZADO, "Leilão deveria estar FINALIZADO com lance")
-            self.assertEqual(self.sistema.obter_ganhador_leilao("LeilaoGanhador"), self.p2)
-
-    @freeze_time("2025-05-23 10:00:00")
+        self._leilao_finalizado_com_lances("LeilaoGanhador", 50, self.anteontem_dt, self.ontem_dt,
+                                           [(self.p1, 60), (self.p2, 70)])
+        self.assertEqual(self.sistema.obter_ganhador_leilao("LeilaoGanhador"), self.p2)
+
+    @time_machine.travel("2025-05-23 10:00:00", tick=False)
     def test_obter_ganhador_leilao_nao_finalizado(self):
         leilao_aberto = self.sistema.cadastrar_leilao("AbertoGanha", 50, self.ontem_dt, self.amanha_dt)
         leilao_expirado = self.sistema.cadastrar_leilao("ExpiradoGanha", 50, self.anteontem_dt, self.ontem_dt)
@@ -444,87 +550,66 @@ class TestSistemaLeiloes(unittest.TestCase):
         self.assertIsNone(self.sistema.obter_ganhador_leilao("ExpiradoGanha"))
 
     def test_obter_ganhador_leilao_inexistente(self):
-        with self.assertRaisesRegex(LeilaoInvalido, r"Leilão com nome \'Inexistente\' não encontrado."):
+        with self.assertRaisesRegex(LeilaoInvalido, _RE_LEILAO_INEXISTENTE):
             self.sistema.obter_ganhador_leilao("Inexistente")
 
     # --- Testes de Notificação ---
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_notificar_ganhador_sucesso(self, mock_stdout):
-        inicio_leilao = self.anteontem_dt
-        fim_leilao = self.ontem_dt
-        tempo_lance = inicio_leilao + timedelta(hours=1)
-        with freeze_time(inicio_leilao - timedelta(hours=1)):
-            leilao = self.sistema.cadastrar_leilao("LeilaoNotifica", 50, inicio_leilao, fim_leilao)
-            self.assertEqual(leilao.estado, EstadoLeilao.INATIVO, "Deveria ser INATIVO antes do início")
-        with freeze_time(tempo_lance):
-            leilao = self.sistema.buscar_leilao_por_nome("LeilaoNotifica")
-            leilao.atualizar_estado()
-            self.assertEqual(leilao.estado, EstadoLeilao.ABERTO, "Leilão deveria estar ABERTO para receber lances")
-            self.sistema.propor_lance_sistema(self.p1.cpf, "LeilaoNotifica", 60)
-            self.sistema.propor_lance_sistema(self.p2.cpf, "LeilaoNotifica", 70)
-        with freeze_time(fim_leilao + timedelta(hours=1)):
-            leilao = self.sistema.buscar_leilao_por_nome("LeilaoNotifica")
-            leilao.atualizar_estado()
-            self.assertEqual(leilao.estado, EstadoLeilao.FINALIZADO, "Leilão deveria estar FINALIZADO para notificar")
-            self.assertTrue(self.sistema.notificar_ganhador("LeilaoNotifica"))
-            output = mock_stdout.getvalue()
-            self.assertIn("--- SIMULAÇÃO DE EMAIL ---", output)
-            self.assertIn(f"Para: {self.p2.email}", output)
-            self.assertIn("Parabéns! Você arrematou o item \'LeilaoNotifica\' com o lance de R$ 70.00.", output)
-            self.assertIn(f"Prezado(a) {self.p2.nome}", output)
-            self.assertIn("R$ 70.00", output)
-
-    @freeze_time("2025-05-23 10:00:00")
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_notificar_ganhador_leilao_nao_finalizado(self, mock_stdout):
-        leilao_aberto = self.sistema.cadastrar_leilao("AbertoNotifica", 50, self.ontem_dt, self.amanha_dt)
-        leilao_aberto.atualizar_estado()
-        self.assertFalse(self.sistema.notificar_ganhador("AbertoNotifica"))
-        expected_output = "INFO: Leilão \'AbertoNotifica\' ainda não foi finalizado (Estado: ABERTO). Nenhuma notificação enviada.\n"
-        self.assertEqual(mock_stdout.getvalue(), expected_output)
-
-    @freeze_time("2025-05-23 10:00:00")
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_notificar_ganhador_leilao_expirado(self, mock_stdout):
-        leilao_expirado = self.sistema.cadastrar_leilao("ExpiradoNotifica", 50, self.anteontem_dt, self.ontem_dt)
-        leilao_expirado.atualizar_estado()
-        self.assertFalse(self.sistema.notificar_ganhador("ExpiradoNotifica"))
-        expected_output = "INFO: Leilão \'ExpiradoNotifica\' ainda não foi finalizado (Estado: EXPIRADO). Nenhuma notificação enviada.\n"
-        self.assertEqual(mock_stdout.getvalue(), expected_output)
+    @time_machine.travel("2025-05-23 10:00:00", tick=False)
+    def test_notificar_ganhador_por_estado(self):
+        self._leilao_finalizado_com_lances("LeilaoNotifica", 50, self.anteontem_dt, self.ontem_dt,
+                                           [(self.p1, 60), (self.p2, 70)])
+        self.sistema.cadastrar_leilao("AbertoNotifica", 50, self.ontem_dt, self.amanha_dt)
+        self.sistema.cadastrar_leilao("ExpiradoNotifica", 50, self.anteontem_dt, self.ontem_dt)
+        casos = (
+            ("LeilaoNotifica", True, _SAIDA_EMAIL_GANHADOR),
+            ("AbertoNotifica", False, _SAIDA_INFO_ABERTO),
+            ("ExpiradoNotifica", False, _SAIDA_INFO_EXPIRADO),
+        )
+        for nome, notificado, saida_esperada in casos:
+            with self.subTest(leilao=nome), redirect_stdout(StringIO()) as saida:
+                self.assertEqual(self.sistema.notificar_ganhador(nome), notificado)
+                self.assertEqual(saida.getvalue(), saida_esperada)
+
+    @time_machine.travel("2025-05-23 10:00:00", tick=False)
+    def test_notificar_ganhador_nao_verboso(self):
+        sistema = SistemaLeiloes(verboso=False)
+        sistema.cadastrar_leilao("Silencioso", 50, self.anteontem_dt, self.ontem_dt)
+        with redirect_stdout(StringIO()) as saida:
+            self.assertFalse(sistema.notificar_ganhador("Silencioso"))
+        self.assertEqual(saida.getvalue(), "")
+        # Um escritor explícito recebe as mensagens mesmo sem o modo verboso
+        mensagens = []
+        self.assertFalse(sistema.notificar_ganhador("Silencioso", escritor=mensagens.append))
+        self.assertEqual(len(mensagens), 1)
+        self.assertTrue(mensagens[0].startswith("INFO: Leilão 'Silencioso' ainda não foi finalizado"))
 
     def test_notificar_ganhador_leilao_inexistente(self):
-         with self.assertRaisesRegex(LeilaoInvalido, r"Leilão com nome \'Inexistente\' não encontrado para notificação."):
+         with self.assertRaisesRegex(LeilaoInvalido, _RE_LEILAO_INEXISTENTE_NOTIFICACAO):
             self.sistema.notificar_ganhador("Inexistente")
 
-    # Testes para cobrir linhas 226-227 e 230-231 de sistema.py (cenários improváveis)
-    # Revisado para usar manipulação direta de atributos internos
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_notificar_ganhador_finalizado_sem_ganhador(self, mock_stdout):
-        leilao = self.sistema.cadastrar_leilao("FinalizadoSemGanhador", 50, self.anteontem_dt, self.ontem_dt)
-        # Adiciona um lance diretamente na lista interna
-        lance = Lance(self.p1, 60)
-        leilao._lances.append(lance)
-        # Força o estado FINALIZADO e remove o ganhador manualmente
-        leilao._estado = EstadoLeilao.FINALIZADO
-        leilao._ganhador = None
-        self.assertFalse(self.sistema.notificar_ganhador("FinalizadoSemGanhador"))
-        expected_output = "AVISO: Leilão \'FinalizadoSemGanhador\' está FINALIZADO mas não possui ganhador definido.\n"
-        self.assertEqual(mock_stdout.getvalue(), expected_output)
-
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_notificar_ganhador_com_ganhador_sem_maior_lance(self, mock_stdout):
-        leilao = self.sistema.cadastrar_leilao("GanhadorSemMaiorLance", 50, self.anteontem_dt, self.ontem_dt)
-        # Adiciona um lance diretamente na lista interna
-        lance = Lance(self.p1, 60)
-        leilao._lances.append(lance)
-        # Força o estado FINALIZADO e o ganhador
+    # Cenários improváveis de notificar_ganhador (ganhador sem lance / FINALIZADO sem ganhador),
+    # provocados pela manipulação direta dos atributos internos de um único leilão
+    def test_notificar_ganhador_finalizado_inconsistente(self):
+        leilao = self.sistema.cadastrar_leilao("FinalizadoInconsistente", 50, self.anteontem_dt, self.ontem_dt)
+        # Adiciona um lance diretamente nos vetores internos e força o estado FINALIZADO
+        leilao._valores.append(60)
+        leilao._ofertantes.append(self.p1)
         leilao._estado = EstadoLeilao.FINALIZADO
-        leilao._ganhador = self.p1
-        # Mocka a property maior_lance para retornar None
-        with patch.object(Leilao, 'maior_lance', new_callable=PropertyMock, return_value=None):
-            self.assertFalse(self.sistema.notificar_ganhador("GanhadorSemMaiorLance"))
-            expected_output = "AVISO: Leilão \'GanhadorSemMaiorLance\' tem ganhador mas não foi possível obter o maior lance.\n"
-            self.assertEqual(mock_stdout.getvalue(), expected_output)
+        casos = (
+            # (ganhador forçado, maior_lance forçado a None, registro de log esperado)
+            (None, False, _LOG_SEM_GANHADOR),
+            (self.p1, True, _LOG_SEM_MAIOR_LANCE),
+        )
+        for ganhador, sem_maior_lance, log_esperado in casos:
+            with self.subTest(ganhador=ganhador, sem_maior_lance=sem_maior_lance), ExitStack() as pilha:
+                leilao._ganhador = ganhador
+                if sem_maior_lance:
+                    pilha.enter_context(_sobrescrever_propriedade(leilao, "maior_lance", None))
+                registros = pilha.enter_context(self.assertLogs("leilao", level="WARNING"))
+                mensagens = []
+                self.assertFalse(self.sistema.notificar_ganhador("FinalizadoInconsistente", escritor=mensagens.append))
+                self.assertEqual(mensagens, []) # Nada é enviado ao escritor
+                self.assertEqual(registros.output, [log_esperado])
 
 if __name__ == "__main__":
     unittest.main()